@@ -14,10 +14,28 @@ import sys
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 DEFAULT_PLUGIN_PATH = Path.home() / "Library/Audio/Plug-Ins/VST3/Monument.vst3"
 
+RESULT_FIELDS = [
+    "preset",
+    "drift",
+    "chaosIntensity",
+    "duration_seconds",
+    "rt60_seconds",
+    "rt60_confidence",
+    "dynamic_range_db",
+    "rms",
+    "peak",
+    "flatness_db",
+    "mean_gain_db",
+    "stability_ok",
+    "runaway",
+    "runaway_reason",
+    "output_dir",
+]
+
 
 def resolve_project_root() -> Path:
     return Path(__file__).resolve().parent.parent
@@ -36,14 +54,17 @@ def resolve_build_dir(project_root: Path, build_dir: Optional[str]) -> Path:
 
 
 def find_analyzer(build_dir: Path, config: str) -> Optional[Path]:
+    artefacts_dir = build_dir / "monument_plugin_analyzer_artefacts"
+    if not artefacts_dir.is_dir():
+        return None
     candidates = [
-        build_dir / "monument_plugin_analyzer_artefacts" / config / "monument_plugin_analyzer",
-        build_dir / "monument_plugin_analyzer_artefacts" / "Debug" / "monument_plugin_analyzer",
-        build_dir / "monument_plugin_analyzer_artefacts" / "Release" / "monument_plugin_analyzer",
-        build_dir / "monument_plugin_analyzer_artefacts" / "RelWithDebInfo" / "monument_plugin_analyzer",
-        build_dir / "monument_plugin_analyzer_artefacts" / "monument_plugin_analyzer",
+        artefacts_dir / config / "monument_plugin_analyzer",
+        artefacts_dir / "Debug" / "monument_plugin_analyzer",
+        artefacts_dir / "Release" / "monument_plugin_analyzer",
+        artefacts_dir / "RelWithDebInfo" / "monument_plugin_analyzer",
+        artefacts_dir / "monument_plugin_analyzer",
     ]
-    for candidate in candidates:
+    for candidate in dict.fromkeys(candidates):
         if candidate.is_file():
             return candidate
     return None
@@ -120,24 +141,40 @@ def run_command(cmd: List[str], log_path: Path) -> int:
     return result.returncode
 
 
+def scan_existing_files(root: Path) -> Set[str]:
+    """Return every file under root as a root-relative POSIX path (one directory walk)."""
+    existing = set()
+    root_text = str(root)
+    for dirpath, _, filenames in os.walk(root_text):
+        rel_dir = os.path.relpath(dirpath, root_text)
+        prefix = "" if rel_dir == "." else Path(rel_dir).as_posix() + "/"
+        existing.update(prefix + name for name in filenames)
+    return existing
+
+
 def load_json(path: Path) -> Optional[dict]:
-    if not path.exists():
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
         return None
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
 
 
 def detect_runaway(rt60_data: Optional[dict], duration_seconds: float) -> Tuple[bool, str]:
     if not rt60_data:
         return False, ""
 
-    notes = str(rt60_data.get("analysis_notes", ""))
-    rt60 = float(rt60_data.get("broadband", {}).get("rt60_seconds", 0.0) or 0.0)
-    if notes and "decay" in notes.lower():
+    # rt60_analysis_robust.py writes analysis_notes as a string and
+    # rt60_seconds as a float (or null), so no coercion is needed here.
+    notes = rt60_data.get("analysis_notes")
+    if notes and "decay" in notes.casefold():
         return True, notes
 
-    if rt60 > 0.0 and rt60 >= duration_seconds * 0.9:
-        return True, f"rt60 >= {duration_seconds * 0.9:.2f}s"
+    broadband = rt60_data.get("broadband")
+    rt60 = broadband.get("rt60_seconds") if broadband else None
+    threshold = duration_seconds * 0.9
+    if isinstance(rt60, (int, float)) and rt60 > 0.0 and rt60 >= threshold:
+        return True, f"rt60 >= {threshold:.2f}s"
 
     return False, ""
 
@@ -176,43 +213,67 @@ def compute_basic_stats(values: List[float]) -> Optional[dict]:
     }
 
 
-def summarize_by_preset(results: List[dict]) -> List[dict]:
+def mean_max(values: List[float]) -> Tuple[Optional[float], Optional[float]]:
+    """Cheap mean/max for per-preset rows; no sort needed unlike compute_basic_stats."""
+    if not values:
+        return None, None
+    return sum(values) / len(values), max(values)
+
+
+def build_result_columns(results: List[dict], constants: Dict[str, object]) -> Dict[str, list]:
+    """Transpose per-run dicts into one list per field (column-oriented view).
+
+    Fields that are identical for every run are not stored per run; they are
+    supplied via ``constants`` and expanded here so the CSV schema is unchanged.
+    """
+    count = len(results)
+    return {
+        field: [constants[field]] * count if field in constants else [run.get(field) for run in results]
+        for field in RESULT_FIELDS
+    }
+
+
+def summarize_by_preset(columns: Dict[str, list]) -> List[dict]:
     summary = {}
-    for run in results:
-        preset = run["preset"]
-        entry = summary.setdefault(
-            preset,
-            {
+    for preset, rt60, flatness, runaway, stability_ok in zip(
+        columns["preset"],
+        columns["rt60_seconds"],
+        columns["flatness_db"],
+        columns["runaway"],
+        columns["stability_ok"],
+    ):
+        entry = summary.get(preset)
+        if entry is None:
+            entry = summary[preset] = {
                 "preset": preset,
                 "runs": 0,
                 "rt60_values": [],
                 "flatness_values": [],
                 "runaways": 0,
                 "stability_failures": 0,
-            },
-        )
+            }
         entry["runs"] += 1
-        if run.get("rt60_seconds") is not None:
-            entry["rt60_values"].append(run["rt60_seconds"])
-        if run.get("flatness_db") is not None:
-            entry["flatness_values"].append(run["flatness_db"])
-        if run.get("runaway"):
+        if rt60 is not None:
+            entry["rt60_values"].append(rt60)
+        if flatness is not None:
+            entry["flatness_values"].append(flatness)
+        if runaway:
             entry["runaways"] += 1
-        if run.get("stability_ok") is False:
+        if stability_ok is False:
             entry["stability_failures"] += 1
 
     preset_rows = []
     for preset in sorted(summary.keys()):
         entry = summary[preset]
-        rt60_stats = compute_basic_stats(entry["rt60_values"]) or {}
-        flatness_stats = compute_basic_stats(entry["flatness_values"]) or {}
+        rt60_mean, rt60_max = mean_max(entry["rt60_values"])
+        flatness_mean, _ = mean_max(entry["flatness_values"])
         preset_rows.append(
             {
                 "preset": preset,
                 "runs": entry["runs"],
-                "rt60_mean": rt60_stats.get("mean"),
-                "rt60_max": rt60_stats.get("max"),
-                "flatness_mean": flatness_stats.get("mean"),
+                "rt60_mean": rt60_mean,
+                "rt60_max": rt60_max,
+                "flatness_mean": flatness_mean,
                 "runaways": entry["runaways"],
                 "stability_failures": entry["stability_failures"],
             }
@@ -220,7 +281,15 @@ def summarize_by_preset(results: List[dict]) -> List[dict]:
     return preset_rows
 
 
+_MATPLOTLIB_CACHE_CONFIGURED = False
+
+
 def configure_matplotlib_cache() -> None:
+    global _MATPLOTLIB_CACHE_CONFIGURED
+    if _MATPLOTLIB_CACHE_CONFIGURED:
+        return
+    _MATPLOTLIB_CACHE_CONFIGURED = True
+
     cache_root = Path(os.environ.get("MPLCONFIGDIR", "")) if os.environ.get("MPLCONFIGDIR") else None
     if not cache_root:
         cache_root = Path(tempfile.gettempdir()) / "monument-mplcache"
@@ -237,34 +306,68 @@ def configure_matplotlib_cache() -> None:
         os.environ.setdefault("XDG_CACHE_HOME", str(cache_root))
 
 
-def build_metric_grid(results: List[dict], drift_values: List[float], chaos_values: List[float], key: str) -> List[List[float]]:
+def _grid_cells(columns: Dict[str, list], drift_values: List[float], chaos_values: List[float], key: str):
+    """Yield (chaos_index, drift_index, value) for every run that lands on the grid."""
+    drift_index_of = {value: index for index, value in enumerate(drift_values)}
+    chaos_index_of = {value: index for index, value in enumerate(chaos_values)}
+    for drift, chaos, value in zip(columns["drift"], columns["chaosIntensity"], columns[key]):
+        drift_index = drift_index_of.get(drift)
+        chaos_index = chaos_index_of.get(chaos)
+        if drift_index is None or chaos_index is None:
+            continue
+        yield chaos_index, drift_index, value
+
+
+def build_metric_grid(columns: Dict[str, list], drift_values: List[float], chaos_values: List[float], key: str) -> List[List[float]]:
+    sums = [[0.0 for _ in drift_values] for _ in chaos_values]
+    counts = [[0 for _ in drift_values] for _ in chaos_values]
+    for chaos_index, drift_index, value in _grid_cells(columns, drift_values, chaos_values, key):
+        if value is None:
+            continue
+        sums[chaos_index][drift_index] += value
+        counts[chaos_index][drift_index] += 1
+
     grid = [[float("nan") for _ in drift_values] for _ in chaos_values]
-    for chaos_index, chaos in enumerate(chaos_values):
-        for drift_index, drift in enumerate(drift_values):
-            values = [
-                run[key]
-                for run in results
-                if run.get("drift") == drift and run.get("chaosIntensity") == chaos and run.get(key) is not None
-            ]
-            if values:
-                grid[chaos_index][drift_index] = sum(values) / len(values)
+    for chaos_index, row in enumerate(counts):
+        for drift_index, count in enumerate(row):
+            if count:
+                grid[chaos_index][drift_index] = sums[chaos_index][drift_index] / count
     return grid
 
 
-def build_count_grid(results: List[dict], drift_values: List[float], chaos_values: List[float], predicate_key: str) -> List[List[int]]:
+def build_count_grid(columns: Dict[str, list], drift_values: List[float], chaos_values: List[float], predicate_key: str) -> List[List[int]]:
     grid = [[0 for _ in drift_values] for _ in chaos_values]
-    for chaos_index, chaos in enumerate(chaos_values):
-        for drift_index, drift in enumerate(drift_values):
-            grid[chaos_index][drift_index] = sum(
-                1
-                for run in results
-                if run.get("drift") == drift and run.get("chaosIntensity") == chaos and run.get(predicate_key)
-            )
+    for chaos_index, drift_index, value in _grid_cells(columns, drift_values, chaos_values, predicate_key):
+        if value:
+            grid[chaos_index][drift_index] += 1
     return grid
 
 
+def render_heatmap(job: Tuple[list, str, Path, str, List[str], List[str]]) -> None:
+    """Render one heatmap PNG into its own Figure."""
+    grid, title, output_path, colorbar_label, drift_labels, chaos_labels = job
+    import matplotlib.pyplot as plt  # pylint: disable=import-error
+    import numpy as np  # pylint: disable=import-error
+
+    data = np.array(grid, dtype=float)
+    fig, ax = plt.subplots(figsize=(6.5, 4.5))
+    im = ax.imshow(data, origin="lower", aspect="auto")
+    ax.set_xticks(range(len(drift_labels)))
+    ax.set_xticklabels(drift_labels)
+    ax.set_yticks(range(len(chaos_labels)))
+    ax.set_yticklabels(chaos_labels)
+    ax.set_xlabel("Drift")
+    ax.set_ylabel("Chaos")
+    ax.set_title(title)
+    cbar = fig.colorbar(im, ax=ax)
+    cbar.ax.set_ylabel(colorbar_label)
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150)
+    plt.close(fig)
+
+
 def generate_summary_plots(
-    results: List[dict],
+    columns: Dict[str, list],
     output_base: Path,
     drift_values: List[float],
     chaos_values: List[float],
@@ -272,48 +375,42 @@ def generate_summary_plots(
 ) -> None:
     try:
         configure_matplotlib_cache()
-        import matplotlib.pyplot as plt  # pylint: disable=import-error
-        import numpy as np  # pylint: disable=import-error
+        import matplotlib.pyplot  # noqa: F401  # pylint: disable=import-error,unused-import
+        import numpy  # noqa: F401  # pylint: disable=import-error,unused-import
     except Exception as exc:
         notes.append(f"Summary plots skipped: {exc}")
         return
 
-    if not results:
+    if not columns["preset"]:
         notes.append("Summary plots skipped: no results")
         return
 
     drift_labels = [format_value(value) for value in drift_values]
     chaos_labels = [format_value(value) for value in chaos_values]
 
-    def render_heatmap(grid: List[List[float]], title: str, output_name: str, colorbar_label: str) -> None:
-        data = np.array(grid, dtype=float)
-        fig, ax = plt.subplots(figsize=(6.5, 4.5))
-        im = ax.imshow(data, origin="lower", aspect="auto")
-        ax.set_xticks(range(len(drift_labels)))
-        ax.set_xticklabels(drift_labels)
-        ax.set_yticks(range(len(chaos_labels)))
-        ax.set_yticklabels(chaos_labels)
-        ax.set_xlabel("Drift")
-        ax.set_ylabel("Chaos")
-        ax.set_title(title)
-        cbar = fig.colorbar(im, ax=ax)
-        cbar.ax.set_ylabel(colorbar_label)
-        plt.tight_layout()
-        output_path = output_base / output_name
-        fig.savefig(output_path, dpi=150)
-        plt.close(fig)
-
-    rt60_grid = build_metric_grid(results, drift_values, chaos_values, "rt60_seconds")
-    render_heatmap(rt60_grid, "RT60 Mean by Drift/Chaos", "rt60_heatmap.png", "RT60 (s)")
-
-    flatness_grid = build_metric_grid(results, drift_values, chaos_values, "flatness_db")
-    render_heatmap(flatness_grid, "Flatness Mean by Drift/Chaos", "flatness_heatmap.png", "Flatness (dB)")
-
-    runaway_grid = build_count_grid(results, drift_values, chaos_values, "runaway")
-    render_heatmap(runaway_grid, "Runaway Count by Drift/Chaos", "runaway_heatmap.png", "Runaway count")
-
-    stability_grid = build_count_grid(results, drift_values, chaos_values, "stability_ok")
-    render_heatmap(stability_grid, "Stability Pass Count by Drift/Chaos", "stability_heatmap.png", "Pass count")
+    heatmaps = [
+        (build_metric_grid(columns, drift_values, chaos_values, "rt60_seconds"),
+         "RT60 Mean by Drift/Chaos", "rt60_heatmap.png", "RT60 (s)"),
+        (build_metric_grid(columns, drift_values, chaos_values, "flatness_db"),
+         "Flatness Mean by Drift/Chaos", "flatness_heatmap.png", "Flatness (dB)"),
+        (build_count_grid(columns, drift_values, chaos_values, "runaway"),
+         "Runaway Count by Drift/Chaos", "runaway_heatmap.png", "Runaway count"),
+        (build_count_grid(columns, drift_values, chaos_values, "stability_ok"),
+         "Stability Pass Count by Drift/Chaos", "stability_heatmap.png", "Pass count"),
+    ]
+    jobs = [
+        (grid, title, output_base / output_name, colorbar_label, drift_labels, chaos_labels)
+        for grid, title, output_name, colorbar_label in heatmaps
+    ]
+
+    # Four small figures render faster in-process than in worker processes
+    # that would each re-import pyplot. A failed plot must not cost the sweep
+    # its report, so it is recorded as a note instead.
+    try:
+        for job in jobs:
+            render_heatmap(job)
+    except Exception as exc:
+        notes.append(f"Summary plots skipped: {exc}")
 
 
 def write_report(
@@ -496,13 +593,22 @@ def main() -> int:
 
     (output_base / "sweep_manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
 
-    results = []
+    total_runs = len(presets) * len(drift_values) * len(chaos_values)
+    results: List[Optional[dict]] = [None] * total_runs
     failures = 0
 
-    for preset, drift, chaos in itertools.product(presets, drift_values, chaos_values):
-        drift_label = format_value(drift)
-        chaos_label = format_value(chaos)
-        run_dir = output_base / f"preset_{preset:02d}" / f"drift_{drift_label}_chaos_{chaos_label}"
+    # One walk of the output tree replaces four stat() calls per run when
+    # reusing a previous sweep; --force never consults it.
+    existing_files = set() if args.force else scan_existing_files(output_base)
+
+    drift_label_of = {value: format_value(value) for value in drift_values}
+    chaos_label_of = {value: format_value(value) for value in chaos_values}
+
+    for run_index, (preset, drift, chaos) in enumerate(itertools.product(presets, drift_values, chaos_values)):
+        drift_label = drift_label_of[drift]
+        chaos_label = chaos_label_of[chaos]
+        run_rel = f"preset_{preset:02d}/drift_{drift_label}_chaos_{chaos_label}"
+        run_dir = output_base / run_rel
         run_dir.mkdir(parents=True, exist_ok=True)
 
         dry_wav = run_dir / "dry.wav"
@@ -510,7 +616,9 @@ def main() -> int:
         rt60_json = run_dir / "rt60_metrics.json"
         freq_json = run_dir / "freq_metrics.json"
 
-        capture_needed = args.force or not (dry_wav.exists() and wet_wav.exists())
+        capture_needed = args.force or not (
+            f"{run_rel}/dry.wav" in existing_files and f"{run_rel}/wet.wav" in existing_files
+        )
         if capture_needed:
             print(f"Capture preset {preset} drift={drift_label} chaos={chaos_label}")
             cmd = [
@@ -559,8 +667,10 @@ def main() -> int:
         freq_data = None
         stability_ok = None
 
-        if not args.no_analysis and wet_wav.exists():
-            rt60_needed = args.force or not rt60_json.exists()
+        # A fresh capture may or may not have produced wet.wav, so only then stat it.
+        wet_available = wet_wav.exists() if capture_needed else True
+        if not args.no_analysis and wet_available:
+            rt60_needed = args.force or f"{run_rel}/rt60_metrics.json" not in existing_files
             if rt60_needed:
                 rt60_cmd = [python_bin, str(rt60_script), str(wet_wav), "--output", str(rt60_json)]
                 if not args.plots:
@@ -572,7 +682,7 @@ def main() -> int:
                     if args.strict:
                         return 1
 
-            freq_needed = args.force or not freq_json.exists()
+            freq_needed = args.force or f"{run_rel}/freq_metrics.json" not in existing_files
             if freq_needed:
                 freq_cmd = [python_bin, str(freq_script), str(wet_wav), "--impulse", "--output", str(freq_json)]
                 if not args.plots:
@@ -612,11 +722,10 @@ def main() -> int:
             flatness_db = freq_data.get("broadband", {}).get("flatness_db")
             mean_gain_db = freq_data.get("broadband", {}).get("mean_gain_db")
 
-        results.append({
+        results[run_index] = {
             "preset": preset,
             "drift": drift,
             "chaosIntensity": chaos,
-            "duration_seconds": args.duration,
             "rt60_seconds": rt60_seconds,
             "rt60_confidence": rt60_confidence,
             "dynamic_range_db": dynamic_range_db,
@@ -627,27 +736,31 @@ def main() -> int:
             "stability_ok": stability_ok,
             "runaway": runaway,
             "runaway_reason": runaway_reason,
-            "output_dir": str(run_dir.relative_to(output_base)),
-        })
+            "output_dir": str(Path(run_rel)),
+        }
+
+    columns = build_result_columns(results, {"duration_seconds": args.duration})
+    rt60_column = columns["rt60_seconds"]
 
     summary = {
         "timestamp": utc_timestamp(),
         "runs_total": len(results),
+        "duration_seconds": args.duration,
         "failures": failures,
-        "runaway_count": sum(1 for item in results if item["runaway"]),
-        "stability_failures": sum(1 for item in results if item["stability_ok"] is False),
+        "runaway_count": sum(1 for runaway in columns["runaway"] if runaway),
+        "stability_failures": sum(1 for stability_ok in columns["stability_ok"] if stability_ok is False),
     }
 
-    rt60_values = [item["rt60_seconds"] for item in results if item["rt60_seconds"]]
-    flatness_values = [item["flatness_db"] for item in results if item["flatness_db"]]
+    rt60_values = [value for value in rt60_column if value]
+    flatness_values = [value for value in columns["flatness_db"] if value]
     if rt60_values:
         max_rt60 = max(rt60_values)
-        max_item = next(item for item in results if item["rt60_seconds"] == max_rt60)
+        max_index = rt60_column.index(max_rt60)
         summary["max_rt60"] = {
             "rt60_seconds": max_rt60,
-            "preset": max_item["preset"],
-            "drift": max_item["drift"],
-            "chaosIntensity": max_item["chaosIntensity"],
+            "preset": columns["preset"][max_index],
+            "drift": columns["drift"][max_index],
+            "chaosIntensity": columns["chaosIntensity"][max_index],
         }
     summary["rt60_stats"] = compute_basic_stats(rt60_values)
     summary["flatness_stats"] = compute_basic_stats(flatness_values)
@@ -657,15 +770,14 @@ def main() -> int:
 
     csv_path = output_base / "sweep_summary.csv"
     with csv_path.open("w", newline="", encoding="utf-8") as csv_file:
-        fieldnames = list(results[0].keys()) if results else []
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+        writer = csv.writer(csv_file)
+        writer.writerow(RESULT_FIELDS if results else [])
+        writer.writerows(zip(*(columns[field] for field in RESULT_FIELDS)))
 
     notes = []
-    preset_rows = summarize_by_preset(results)
+    preset_rows = summarize_by_preset(columns)
     if args.plots:
-        generate_summary_plots(results, output_base, drift_values, chaos_values, notes)
+        generate_summary_plots(columns, output_base, drift_values, chaos_values, notes)
     report_path = write_report(output_base, manifest, summary, results, preset_rows, notes)
 
     print("\nSweep complete")
@@ -6,23 +6,45 @@ Capture Monument UI screenshots for visual regression baselines.
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import json
 import os
+import queue
 import shutil
+import string
 import subprocess
 import sys
+import threading
 import time
 import ctypes
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional; json is used instead
+    orjson = None
+
 
 DEFAULT_DELAY = 0.6
 DEFAULT_PROCESS_NAME = "Monument"
 DEFAULT_WINDOW_METHOD = "auto"
 DEFAULT_BUILD_DIR = "build"
+PNG_COMPRESS_LEVEL = 1
+
+
+def resolve_system_tool(name: str, default_path: str) -> Optional[str]:
+    """Prefer the fixed macOS location and only search $PATH if it is missing."""
+    return default_path if os.path.exists(default_path) else shutil.which(name)
+
+
+# Resolved once at import instead of walking $PATH per capture.
+SCREENCAPTURE_BIN = resolve_system_tool("screencapture", "/usr/sbin/screencapture")
+OSASCRIPT_BIN = resolve_system_tool("osascript", "/usr/bin/osascript") or "osascript"
 
 
 @dataclass
@@ -45,19 +67,183 @@ def run_command(command: List[str]) -> subprocess.CompletedProcess:
     return subprocess.run(command, capture_output=True, text=True, check=False)
 
 
+def run_command_quiet(command: List[str], error: str) -> None:
+    """Run a command whose stdout is unused; decode stderr only if it fails."""
+    result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode("utf-8", "replace").strip() or error)
+
+
+class OsaScriptSession:
+    """Long-lived ``osascript -i`` child that evaluates scripts over a pipe.
+
+    Each script is sent as a single ``run script "..."`` line followed by a
+    sentinel expression; everything echoed before the sentinel is the result.
+    Script errors are caught inside AppleScript and reported with a prefix so
+    one failing script does not end the session; anything the interpreter
+    writes to stderr instead (e.g. a script that does not compile) is raised
+    as the error for the script that produced it.
+    """
+
+    SENTINEL = "__MONUMENT_OSA_END__"
+    ERROR_PREFIX = "__MONUMENT_OSA_ERROR__:"
+    PROMPTS = (">> ", "?> ", "=> ")
+
+    def __init__(self, timeout: float = 30.0) -> None:
+        self.timeout = timeout
+        self.process = subprocess.Popen(
+            [OSASCRIPT_BIN, "-i"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        self.lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self.errors: "queue.Queue[str]" = queue.Queue()
+        reader = threading.Thread(target=self._read_stdout, name="osascript-reader", daemon=True)
+        reader.start()
+        error_reader = threading.Thread(target=self._read_stderr, name="osascript-stderr", daemon=True)
+        error_reader.start()
+
+    def _read_stdout(self) -> None:
+        for line in self.process.stdout:
+            self.lines.put(line)
+        self.lines.put(None)
+
+    def _read_stderr(self) -> None:
+        for line in self.process.stderr:
+            text = line.strip()
+            if text and text not in (prompt.strip() for prompt in self.PROMPTS):
+                self.errors.put(text)
+
+    def _drain_errors(self) -> List[str]:
+        errors = []
+        while True:
+            try:
+                errors.append(self.errors.get_nowait())
+            except queue.Empty:
+                return errors
+
+    def eval(self, script: str) -> str:
+        wrapped = (
+            f"try\n{script}\non error errMsg\n"
+            f'return "{self.ERROR_PREFIX}" & errMsg\nend try'
+        )
+        literal = escape_applescript(wrapped).replace("\n", "\\n").replace("\r", "\\r")
+        self._drain_errors()  # Drop anything left over from an earlier script
+        try:
+            self.process.stdin.write(f'run script "{literal}"\n"{self.SENTINEL}"\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as exc:
+            raise RuntimeError("osascript session closed") from exc
+
+        output: List[str] = []
+        while True:
+            try:
+                line = self.lines.get(timeout=self.timeout)
+            except queue.Empty as exc:
+                self.close()
+                raise RuntimeError("osascript session timed out") from exc
+            if line is None:
+                self.close()
+                raise RuntimeError("osascript session closed")
+            if self.SENTINEL in line:
+                break
+            text = line.rstrip("\n")
+            while text.startswith(self.PROMPTS):
+                text = text[3:]
+            output.append(text)
+
+        # Only the trailing newline goes: a leading empty line is a real value
+        # (e.g. an unnamed first button in set_frontmost's name list)
+        result = "\n".join(output).rstrip("\n")
+        if result.startswith(self.ERROR_PREFIX):
+            raise RuntimeError(result[len(self.ERROR_PREFIX):].strip() or "osascript failed")
+
+        # stderr is read on its own thread, so give an error that explains an
+        # empty result a moment to arrive before trusting the result
+        errors = self._drain_errors()
+        if not result and not errors:
+            try:
+                errors.append(self.errors.get(timeout=0.05))
+            except queue.Empty:
+                pass
+        if errors:
+            raise RuntimeError("\n".join(errors))
+        return result
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=2.0)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+
+
+_OSA_SESSION: Optional[OsaScriptSession] = None
+_OSA_SESSION_DISABLED = False
+
+
+def get_osascript_session() -> Optional[OsaScriptSession]:
+    global _OSA_SESSION, _OSA_SESSION_DISABLED
+    if _OSA_SESSION is None and not _OSA_SESSION_DISABLED:
+        try:
+            _OSA_SESSION = OsaScriptSession()
+        except OSError:
+            _OSA_SESSION_DISABLED = True
+        else:
+            atexit.register(_OSA_SESSION.close)
+    return _OSA_SESSION
+
+
 def run_osascript(script: str) -> str:
-    result = run_command(["osascript", "-e", script])
+    global _OSA_SESSION, _OSA_SESSION_DISABLED
+    session = get_osascript_session()
+    if session is not None:
+        if session.process.poll() is None:
+            return session.eval(script)
+        # The interpreter exited; use one-shot osascript from here on.
+        _OSA_SESSION = None
+        _OSA_SESSION_DISABLED = True
+
+    result = run_command([OSASCRIPT_BIN, "-e", script])
     if result.returncode != 0:
         stderr = result.stderr.strip() or "osascript failed"
         raise RuntimeError(stderr)
-    return result.stdout.strip()
+    return result.stdout.rstrip("\n")
 
 
 def escape_applescript(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"')
 
 
+K_CF_STRING_ENCODING_UTF8 = 0x08000100
+K_CF_NUMBER_SINT64 = 4
+K_CF_NUMBER_DOUBLE = 13
+
+K_CG_WINDOW_LIST_OPTION_ON_SCREEN_ONLY = 1 << 0
+K_CG_WINDOW_LIST_OPTION_INCLUDING_WINDOW = 1 << 3
+K_CG_WINDOW_LIST_EXCLUDE_DESKTOP_ELEMENTS = 1 << 4
+K_CG_NULL_WINDOW_ID = 0
+
+CG_WINDOW_KEY_NAMES = {
+    "owner": "kCGWindowOwnerName",
+    "number": "kCGWindowNumber",
+    "bounds": "kCGWindowBounds",
+    "onscreen": "kCGWindowIsOnscreen",
+    "layer": "kCGWindowLayer",
+    "x": "X",
+    "y": "Y",
+    "w": "Width",
+    "h": "Height",
+}
+
+
+@functools.lru_cache(maxsize=1)
 def load_coregraphics():
+    """dlopen CoreGraphics/CoreFoundation once and declare every signature we call."""
     try:
         core_graphics = ctypes.cdll.LoadLibrary(
             "/System/Library/Frameworks/CoreGraphics.framework/CoreGraphics"
@@ -65,21 +251,37 @@ def load_coregraphics():
         core_foundation = ctypes.cdll.LoadLibrary(
             "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
         )
-        return core_graphics, core_foundation
     except OSError:
         return None, None
 
+    core_graphics.CGWindowListCopyWindowInfo.argtypes = [
+        ctypes.c_uint32,
+        ctypes.c_uint32,
+    ]
+    core_graphics.CGWindowListCopyWindowInfo.restype = ctypes.c_void_p
 
-def cfstring_to_py(core_foundation, value: ctypes.c_void_p) -> str:
-    if not value:
-        return ""
-    k_cf_string_encoding_utf8 = 0x08000100
+    core_foundation.CFArrayGetCount.argtypes = [ctypes.c_void_p]
+    core_foundation.CFArrayGetCount.restype = ctypes.c_long
+    core_foundation.CFArrayGetValueAtIndex.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_long,
+    ]
+    core_foundation.CFArrayGetValueAtIndex.restype = ctypes.c_void_p
+    core_foundation.CFDictionaryGetValue.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+    ]
+    core_foundation.CFDictionaryGetValue.restype = ctypes.c_void_p
+    core_foundation.CFStringCreateWithCString.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_char_p,
+        ctypes.c_uint32,
+    ]
+    core_foundation.CFStringCreateWithCString.restype = ctypes.c_void_p
+    core_foundation.CFRelease.argtypes = [ctypes.c_void_p]
+    core_foundation.CFRelease.restype = None
     core_foundation.CFStringGetCStringPtr.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
     core_foundation.CFStringGetCStringPtr.restype = ctypes.c_char_p
-    ptr = core_foundation.CFStringGetCStringPtr(value, k_cf_string_encoding_utf8)
-    if ptr:
-        return ctypes.cast(ptr, ctypes.c_char_p).value.decode("utf-8")
-
     core_foundation.CFStringGetLength.argtypes = [ctypes.c_void_p]
     core_foundation.CFStringGetLength.restype = ctypes.c_long
     core_foundation.CFStringGetMaximumSizeForEncoding.argtypes = [
@@ -94,14 +296,102 @@ def cfstring_to_py(core_foundation, value: ctypes.c_void_p) -> str:
         ctypes.c_uint32,
     ]
     core_foundation.CFStringGetCString.restype = ctypes.c_bool
+    core_foundation.CFNumberGetValue.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    core_foundation.CFNumberGetValue.restype = ctypes.c_bool
+    core_foundation.CFBooleanGetValue.argtypes = [ctypes.c_void_p]
+    core_foundation.CFBooleanGetValue.restype = ctypes.c_bool
+    return core_graphics, core_foundation
+
+
+@functools.lru_cache(maxsize=1)
+def load_window_info_keys() -> Optional[Dict[str, int]]:
+    """Create the CGWindow dictionary keys once; they are immutable for the process lifetime."""
+    _, core_foundation = load_coregraphics()
+    if not core_foundation:
+        return None
+    keys = {
+        alias: core_foundation.CFStringCreateWithCString(
+            None, name.encode("utf-8"), K_CF_STRING_ENCODING_UTF8
+        )
+        for alias, name in CG_WINDOW_KEY_NAMES.items()
+    }
+    if not all(keys.values()):
+        # A NULL key would crash CFDictionaryGetValue; release the rest in one pass.
+        for key in keys.values():
+            if key:
+                core_foundation.CFRelease(key)
+        return None
+    return keys
+
+
+class CGPoint(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_double), ("y", ctypes.c_double)]
+
+
+class CGSize(ctypes.Structure):
+    _fields_ = [("width", ctypes.c_double), ("height", ctypes.c_double)]
+
+
+class CGRect(ctypes.Structure):
+    _fields_ = [("origin", CGPoint), ("size", CGSize)]
+
+
+@functools.lru_cache(maxsize=1)
+def load_skylight():
+    """dlopen the private SkyLight framework for direct window-bounds queries."""
+    try:
+        skylight = ctypes.cdll.LoadLibrary(
+            "/System/Library/PrivateFrameworks/SkyLight.framework/SkyLight"
+        )
+        skylight.SLSMainConnectionID.argtypes = []
+        skylight.SLSMainConnectionID.restype = ctypes.c_int
+        skylight.SLSGetWindowBounds.argtypes = [
+            ctypes.c_int,
+            ctypes.c_uint32,
+            ctypes.POINTER(CGRect),
+        ]
+        skylight.SLSGetWindowBounds.restype = ctypes.c_int
+        return skylight, skylight.SLSMainConnectionID()
+    except (OSError, AttributeError):
+        return None, None
+
+
+def get_window_bounds_sls(window_id: int) -> Optional[Dict[str, int]]:
+    """Ask WindowServer for one window's bounds without enumerating the window list."""
+    skylight, connection = load_skylight()
+    if not skylight or not window_id:
+        return None
+    rect = CGRect()
+    if skylight.SLSGetWindowBounds(connection, window_id, ctypes.byref(rect)) != 0:
+        return None
+    if rect.size.width <= 0 or rect.size.height <= 0:
+        return None
+    return {
+        "x": int(round(rect.origin.x)),
+        "y": int(round(rect.origin.y)),
+        "width": int(round(rect.size.width)),
+        "height": int(round(rect.size.height)),
+    }
+
+
+def cfstring_to_py(core_foundation, value: ctypes.c_void_p) -> str:
+    if not value:
+        return ""
+    ptr = core_foundation.CFStringGetCStringPtr(value, K_CF_STRING_ENCODING_UTF8)
+    if ptr:
+        return ptr.decode("utf-8")
 
     length = core_foundation.CFStringGetLength(value)
     max_size = core_foundation.CFStringGetMaximumSizeForEncoding(
-        length, k_cf_string_encoding_utf8
+        length, K_CF_STRING_ENCODING_UTF8
     )
     buffer = ctypes.create_string_buffer(max_size + 1)
     ok = core_foundation.CFStringGetCString(
-        value, buffer, max_size + 1, k_cf_string_encoding_utf8
+        value, buffer, max_size + 1, K_CF_STRING_ENCODING_UTF8
     )
     if not ok:
         return ""
@@ -111,38 +401,22 @@ def cfstring_to_py(core_foundation, value: ctypes.c_void_p) -> str:
 def cfnumber_to_int(core_foundation, value: ctypes.c_void_p) -> int:
     if not value:
         return 0
-    k_cf_number_sint64 = 4
     result = ctypes.c_longlong()
-    core_foundation.CFNumberGetValue.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_void_p,
-    ]
-    core_foundation.CFNumberGetValue.restype = ctypes.c_bool
-    core_foundation.CFNumberGetValue(value, k_cf_number_sint64, ctypes.byref(result))
+    core_foundation.CFNumberGetValue(value, K_CF_NUMBER_SINT64, ctypes.byref(result))
     return int(result.value)
 
 
 def cfnumber_to_float(core_foundation, value: ctypes.c_void_p) -> float:
     if not value:
         return 0.0
-    k_cf_number_double = 13
     result = ctypes.c_double()
-    core_foundation.CFNumberGetValue.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_void_p,
-    ]
-    core_foundation.CFNumberGetValue.restype = ctypes.c_bool
-    core_foundation.CFNumberGetValue(value, k_cf_number_double, ctypes.byref(result))
+    core_foundation.CFNumberGetValue(value, K_CF_NUMBER_DOUBLE, ctypes.byref(result))
     return float(result.value)
 
 
 def cfbool_to_bool(core_foundation, value: ctypes.c_void_p) -> bool:
     if not value:
         return False
-    core_foundation.CFBooleanGetValue.argtypes = [ctypes.c_void_p]
-    core_foundation.CFBooleanGetValue.restype = ctypes.c_bool
     return bool(core_foundation.CFBooleanGetValue(value))
 
 
@@ -183,17 +457,75 @@ def launch_app(app_path: Path) -> None:
         raise RuntimeError(result.stderr.strip() or "Failed to launch app")
 
 
-def set_frontmost(process_name: str) -> None:
+def quit_app(process_name: str) -> None:
+    """Ask the app to quit through the osascript session (no extra kill process)."""
+    escaped = escape_applescript(process_name)
+    try:
+        run_osascript(
+            f'if application "{escaped}" is running then tell application "{escaped}" to quit'
+        )
+    except RuntimeError as exc:
+        print(f"WARNING: could not quit {process_name}: {exc}", file=sys.stderr)
+
+
+APPLESCRIPT_RETURN_BOUNDS = '''
+    if (count of windows) = 0 then return status
+    set win to window 1
+    set pos to position of win
+    set sz to size of win
+    return status & "," & (item 1 of pos) & "," & (item 2 of pos) & "," & (item 1 of sz) & "," & (item 2 of sz)'''
+
+
+def parse_status_and_bounds(output: str) -> Tuple[str, Optional[Dict[str, int]]]:
+    """Split a "status[,x,y,width,height]" AppleScript reply."""
+    parts = output.strip().split(",")
+    status = parts[0].strip()
+    if len(parts) != 5:
+        return status, None
+    try:
+        x, y, width, height = [int(float(p)) for p in parts[1:]]
+    except ValueError:
+        return status, None
+    return status, {"x": x, "y": y, "width": width, "height": height}
+
+
+def set_frontmost(
+    process_name: str,
+    list_buttons: bool = False,
+) -> Tuple[Optional[Dict[str, int]], Dict[str, int]]:
+    """Bring the process to the front and return its window bounds in the same round-trip.
+
+    With list_buttons the front window's button names are read by the same
+    script and returned as a name -> 1-based index map for click_button().
+    """
     escaped = escape_applescript(process_name)
+    button_query = ""
+    if list_buttons:
+        # Names go on the lines before the status/bounds line. A failing AX
+        # query only costs the index; the bounds are still returned.
+        button_query = '''
+    if (count of windows) > 0 then
+      try
+        set AppleScript's text item delimiters to linefeed
+        set status to ((name of every button of window 1) as text) & linefeed & status
+      end try
+    end if'''
     script = f'''
 tell application "System Events"
   if not (exists process "{escaped}") then return ""
   tell process "{escaped}"
     set frontmost to true
+    set status to "ok"{button_query}{APPLESCRIPT_RETURN_BOUNDS}
   end tell
 end tell
 '''
-    run_osascript(script)
+    lines = run_osascript(script).split("\n")
+    _, bounds = parse_status_and_bounds(lines[-1])
+    button_index: Dict[str, int] = {}
+    for position, name in enumerate(lines[:-1], start=1):
+        if name and name != "missing value":
+            button_index.setdefault(name, position)
+    return bounds, button_index
 
 
 def get_window_info(process_name: str) -> Optional[Dict[str, int]]:
@@ -230,62 +562,49 @@ end tell
     }
 
 
-def get_window_info_cg(process_name: str) -> Optional[Dict[str, int]]:
+def get_window_info_cg(process_name: str, window_id: Optional[int] = None) -> Optional[Dict[str, int]]:
+    """Look up the largest on-screen window of process_name via CGWindowList.
+
+    When window_id is already known only that window is described, instead of
+    enumerating every on-screen window.
+    """
     core_graphics, core_foundation = load_coregraphics()
     if not core_graphics or not core_foundation:
         return None
 
-    core_graphics.CGWindowListCopyWindowInfo.argtypes = [
-        ctypes.c_uint32,
-        ctypes.c_uint32,
-    ]
-    core_graphics.CGWindowListCopyWindowInfo.restype = ctypes.c_void_p
-
-    core_foundation.CFArrayGetCount.argtypes = [ctypes.c_void_p]
-    core_foundation.CFArrayGetCount.restype = ctypes.c_long
-    core_foundation.CFArrayGetValueAtIndex.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_long,
-    ]
-    core_foundation.CFArrayGetValueAtIndex.restype = ctypes.c_void_p
-    core_foundation.CFDictionaryGetValue.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_void_p,
-    ]
-    core_foundation.CFDictionaryGetValue.restype = ctypes.c_void_p
-    core_foundation.CFStringCreateWithCString.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        ctypes.c_uint32,
-    ]
-    core_foundation.CFStringCreateWithCString.restype = ctypes.c_void_p
-    core_foundation.CFRelease.argtypes = [ctypes.c_void_p]
-    core_foundation.CFRelease.restype = None
-
-    def cfkey(name: str) -> ctypes.c_void_p:
-        k_cf_string_encoding_utf8 = 0x08000100
-        return core_foundation.CFStringCreateWithCString(
-            None, name.encode("utf-8"), k_cf_string_encoding_utf8
+    keys = load_window_info_keys()
+    if not keys:
+        return None
+    key_owner = keys["owner"]
+    key_number = keys["number"]
+    key_bounds = keys["bounds"]
+    key_onscreen = keys["onscreen"]
+    key_layer = keys["layer"]
+    key_x = keys["x"]
+    key_y = keys["y"]
+    key_w = keys["w"]
+    key_h = keys["h"]
+
+    if window_id:
+        window_list = core_graphics.CGWindowListCopyWindowInfo(
+            K_CG_WINDOW_LIST_OPTION_INCLUDING_WINDOW, window_id
+        )
+    else:
+        # Let WindowServer drop off-screen windows and desktop elements rather
+        # than converting every window dictionary in Python.
+        window_list = core_graphics.CGWindowListCopyWindowInfo(
+            K_CG_WINDOW_LIST_OPTION_ON_SCREEN_ONLY | K_CG_WINDOW_LIST_EXCLUDE_DESKTOP_ELEMENTS,
+            K_CG_NULL_WINDOW_ID,
         )
-
-    key_owner = cfkey("kCGWindowOwnerName")
-    key_window = cfkey("kCGWindowName")
-    key_number = cfkey("kCGWindowNumber")
-    key_bounds = cfkey("kCGWindowBounds")
-    key_onscreen = cfkey("kCGWindowIsOnscreen")
-    key_layer = cfkey("kCGWindowLayer")
-    key_x = cfkey("X")
-    key_y = cfkey("Y")
-    key_w = cfkey("Width")
-    key_h = cfkey("Height")
-
-    window_list = core_graphics.CGWindowListCopyWindowInfo(1, 0)
     if not window_list:
         return None
 
     try:
         count = core_foundation.CFArrayGetCount(window_list)
-        candidates = []
+        # Only the largest matching window is used, so keep a running maximum
+        # instead of collecting and sorting every candidate.
+        best: Optional[Dict[str, int]] = None
+        best_area = 0
         for idx in range(count):
             entry = core_foundation.CFArrayGetValueAtIndex(window_list, idx)
             owner = cfstring_to_py(
@@ -294,10 +613,6 @@ def get_window_info_cg(process_name: str) -> Optional[Dict[str, int]]:
             )
             if owner != process_name:
                 continue
-            window_number = cfnumber_to_int(
-                core_foundation,
-                core_foundation.CFDictionaryGetValue(entry, key_number),
-            )
             layer = cfnumber_to_int(
                 core_foundation,
                 core_foundation.CFDictionaryGetValue(entry, key_layer),
@@ -306,9 +621,22 @@ def get_window_info_cg(process_name: str) -> Optional[Dict[str, int]]:
                 core_foundation,
                 core_foundation.CFDictionaryGetValue(entry, key_onscreen),
             )
+            if not onscreen or layer != 0:
+                continue
             bounds = core_foundation.CFDictionaryGetValue(entry, key_bounds)
             if not bounds:
                 continue
+            width = int(round(cfnumber_to_float(
+                core_foundation,
+                core_foundation.CFDictionaryGetValue(bounds, key_w),
+            )))
+            height = int(round(cfnumber_to_float(
+                core_foundation,
+                core_foundation.CFDictionaryGetValue(bounds, key_h),
+            )))
+            if width <= 0 or height <= 0 or width * height <= best_area:
+                continue
+
             x = cfnumber_to_float(
                 core_foundation,
                 core_foundation.CFDictionaryGetValue(bounds, key_x),
@@ -317,50 +645,37 @@ def get_window_info_cg(process_name: str) -> Optional[Dict[str, int]]:
                 core_foundation,
                 core_foundation.CFDictionaryGetValue(bounds, key_y),
             )
-            width = cfnumber_to_float(
-                core_foundation,
-                core_foundation.CFDictionaryGetValue(bounds, key_w),
-            )
-            height = cfnumber_to_float(
-                core_foundation,
-                core_foundation.CFDictionaryGetValue(bounds, key_h),
-            )
-            window_name = cfstring_to_py(
+            window_number = cfnumber_to_int(
                 core_foundation,
-                core_foundation.CFDictionaryGetValue(entry, key_window),
-            )
-
-            if not onscreen or layer != 0:
-                continue
-            if width <= 0 or height <= 0:
-                continue
-
-            candidates.append(
-                {
-                    "id": window_number,
-                    "x": int(round(x)),
-                    "y": int(round(y)),
-                    "width": int(round(width)),
-                    "height": int(round(height)),
-                    "name": window_name,
-                }
+                core_foundation.CFDictionaryGetValue(entry, key_number),
             )
+            best_area = width * height
+            best = {
+                "id": window_number,
+                "x": int(round(x)),
+                "y": int(round(y)),
+                "width": width,
+                "height": height,
+            }
 
-        if not candidates:
-            return None
-        candidates.sort(key=lambda item: item["width"] * item["height"], reverse=True)
-        best = candidates[0]
-        return {
-            "id": best["id"],
-            "x": best["x"],
-            "y": best["y"],
-            "width": best["width"],
-            "height": best["height"],
-        }
+        return best
     finally:
         core_foundation.CFRelease(window_list)
 
 
+def warm_up(capture_mode: str, automate: bool, analyze: bool = False) -> None:
+    """Do the one-time framework, interpreter and import work off the critical path."""
+    if analyze:
+        load_imaging()
+    if automate:
+        load_coregraphics()
+        load_window_info_keys()
+        load_skylight()
+        get_osascript_session()
+    if capture_mode == "pyautogui":
+        load_pyautogui()
+
+
 def wait_for_window(process_name: str, timeout: float) -> Dict[str, int]:
     deadline = time.time() + timeout
     while time.time() < deadline:
@@ -397,36 +712,86 @@ def resolve_window_info(process_name: str, timeout: float, method: str) -> Dict[
     raise RuntimeError(last_error or "Unable to resolve window info")
 
 
-def click_button(process_name: str, label: str) -> bool:
+def refresh_window_info(process_name: str, window_info: Dict[str, int], method: str) -> Dict[str, int]:
+    """Re-read bounds of an already-resolved window, keeping the cached info on failure."""
+    info: Optional[Dict[str, int]] = None
+    if method in ("auto", "cgwindow"):
+        bounds = get_window_bounds_sls(window_info.get("id"))
+        if bounds:
+            return {**window_info, **bounds}
+        info = get_window_info_cg(process_name, window_info.get("id")) or get_window_info_cg(process_name)
+    if not info and method in ("auto", "applescript"):
+        try:
+            info = get_window_info(process_name)
+        except RuntimeError:
+            info = None
+    return info or window_info
+
+
+def click_button(
+    process_name: str,
+    label: str,
+    index: Optional[int] = None,
+) -> Tuple[bool, Optional[Dict[str, int]]]:
+    """Click a labelled button and return (clicked, window bounds) from a single script.
+
+    With an index from set_frontmost() the button is addressed directly (after
+    checking its name, in case the hierarchy changed); otherwise, or if that
+    check fails, AppleScript searches for it by name/title.
+
+    The process is brought back to the front in the same script, so a focus
+    change mid-run (a notification, a click elsewhere) does not send this
+    click or the next region capture to another window.
+    """
     escaped_process = escape_applescript(process_name)
     escaped_label = escape_applescript(label)
+    indexed_click = ""
+    if index is not None:
+        indexed_click = f'''
+    try
+      set target to button {int(index)} of window 1
+      if name of target is "{escaped_label}" then
+        click target
+        set status to "ok"
+      end if
+    end try'''
     script = f'''
 tell application "System Events"
   if not (exists process "{escaped_process}") then return "missing"
   tell process "{escaped_process}"
     set frontmost to true
-    try
-      click (first button whose name is "{escaped_label}")
-      return "ok"
-    on error
+    set status to "missing"{indexed_click}
+    if status is "missing" then
       try
-        click (first button whose title is "{escaped_label}")
-        return "ok"
+        click (first button whose name is "{escaped_label}")
+        set status to "ok"
       on error
-        return "missing"
+        try
+          click (first button whose title is "{escaped_label}")
+          set status to "ok"
+        end try
       end try
-    end try
+    end if{APPLESCRIPT_RETURN_BOUNDS}
   end tell
 end tell
 '''
-    output = run_osascript(script)
-    return output.strip() == "ok"
+    status, bounds = parse_status_and_bounds(run_osascript(script))
+    return status == "ok", bounds
 
 
-def click_coords(window_info: Dict[str, int], coords: Tuple[float, float]) -> bool:
+@functools.lru_cache(maxsize=1)
+def load_pyautogui():
+    """Import pyautogui on first use only; it talks to the display server at import time."""
     try:
         import pyautogui  # type: ignore
     except ImportError:
+        return None
+    return pyautogui
+
+
+def click_coords(window_info: Dict[str, int], coords: Tuple[float, float]) -> bool:
+    pyautogui = load_pyautogui()
+    if pyautogui is None:
         return False
     x = int(window_info["x"] + window_info["width"] * coords[0])
     y = int(window_info["y"] + window_info["height"] * coords[1])
@@ -438,76 +803,117 @@ def capture_window(
     mode: str,
     window_info: Dict[str, int],
     output_path: Path,
-) -> None:
+    region: bool = False,
+):
+    """Capture the window.
+
+    screencapture writes output_path itself and None is returned. pyautogui
+    returns the in-memory PIL image instead; the caller analyses it without a
+    PNG round-trip and saves it to output_path off the critical path.
+
+    With region, screencapture grabs the window's screen rectangle (-R), which
+    is cheaper than a window-id capture (-l) but also picks up anything
+    overlapping the window and the desktop behind its rounded corners, so
+    region and window captures are not pixel-comparable.
+    """
     if mode == "screencapture":
-        result = run_command(
+        if not SCREENCAPTURE_BIN:
+            raise RuntimeError("screencapture not available")
+        has_bounds = all(window_info.get(key) is not None for key in ("x", "y", "width", "height"))
+        if region and has_bounds:
+            target = [
+                "-R",
+                f'{window_info["x"]},{window_info["y"]},{window_info["width"]},{window_info["height"]}',
+            ]
+        else:
+            # -o (no shadow) only applies to window captures
+            target = ["-o", "-l", str(window_info["id"])]
+        run_command_quiet(
             [
-                "screencapture",
+                SCREENCAPTURE_BIN,
                 "-x",
-                "-o",
-                "-l",
-                str(window_info["id"]),
+                "-t",
+                "png",
+                *target,
                 str(output_path),
-            ]
+            ],
+            "screencapture failed",
         )
-        if result.returncode != 0:
-            raise RuntimeError(result.stderr.strip() or "screencapture failed")
-        return
+        return None
 
     if mode == "pyautogui":
-        try:
-            import pyautogui  # type: ignore
-        except ImportError as exc:
-            raise RuntimeError("pyautogui not installed") from exc
+        pyautogui = load_pyautogui()
+        if pyautogui is None:
+            raise RuntimeError("pyautogui not installed")
         region = (
             window_info["x"],
             window_info["y"],
             window_info["width"],
             window_info["height"],
         )
-        image = pyautogui.screenshot(region=region)
-        image.save(output_path)
-        return
+        return pyautogui.screenshot(region=region)
 
     raise RuntimeError(f"Unknown capture mode: {mode}")
 
 
 def capture_interactive(output_path: Path) -> None:
-    if not shutil.which("screencapture"):
+    if not SCREENCAPTURE_BIN:
         raise RuntimeError("screencapture not available for manual capture")
-    result = run_command(["screencapture", "-i", "-o", str(output_path)])
-    if result.returncode != 0:
-        raise RuntimeError(result.stderr.strip() or "screencapture failed")
+    run_command_quiet([SCREENCAPTURE_BIN, "-i", "-o", str(output_path)], "screencapture failed")
 
 
-def analyze_image(image_path: Path) -> Dict[str, object]:
+def luminance(rgb) -> float:
+    return 0.2126 * rgb[0] + 0.7152 * rgb[1] + 0.0722 * rgb[2]
+
+
+@functools.lru_cache(maxsize=1)
+def load_imaging():
+    """Import numpy and Pillow on first use; (None, None) if either is missing.
+
+    --help, --report-only and --no-analysis runs never pay for the import.
+    """
     try:
-        from PIL import Image, ImageStat
-    except ImportError as exc:
-        raise RuntimeError("pillow not installed") from exc
+        import numpy as np
+        from PIL import Image
+    except ImportError:
+        return None, None
+    return np, Image
+
+
+def load_pixels(source):
+    """Return a (height, width, 3) uint8 array from an image path or an in-memory PIL image."""
+    np, Image = load_imaging()
+    if np is None or Image is None:
+        raise RuntimeError("pillow and numpy are required for image analysis")
+
+    if isinstance(source, Path):
+        with Image.open(source) as image:
+            return np.asarray(image.convert("RGB"))
+    return np.asarray(source.convert("RGB"))
 
-    image = Image.open(image_path).convert("RGB")
-    stat = ImageStat.Stat(image)
-    mean = stat.mean
-    avg_brightness = 0.2126 * mean[0] + 0.7152 * mean[1] + 0.0722 * mean[2]
 
-    width, height = image.size
+def analyze_image(image_path: Path) -> Dict[str, object]:
+    return analyze_pixels(load_pixels(image_path))
+
+
+def analyze_pixels(pixels) -> Dict[str, object]:
+    # Every statistic below is a C-level reduction over the decoded buffer or
+    # a view of it.
+    height, width = pixels.shape[:2]
+    mean = pixels.mean(axis=(0, 1)).tolist()
+    avg_brightness = luminance(mean)
+
     sample = min(20, width, height)
     corners = {
-        "top_left": (0, 0),
-        "top_right": (width - sample, 0),
-        "bottom_left": (0, height - sample),
-        "bottom_right": (width - sample, height - sample),
+        "top_left": pixels[:sample, :sample],
+        "top_right": pixels[:sample, width - sample:],
+        "bottom_left": pixels[height - sample:, :sample],
+        "bottom_right": pixels[height - sample:, width - sample:],
+    }
+    corner_brightness = {
+        name: round(luminance(region.mean(axis=(0, 1)).tolist()), 2)
+        for name, region in corners.items()
     }
-    corner_brightness = {}
-    for name, (x, y) in corners.items():
-        crop = image.crop((x, y, x + sample, y + sample))
-        cstat = ImageStat.Stat(crop)
-        cmean = cstat.mean
-        corner_brightness[name] = round(
-            0.2126 * cmean[0] + 0.7152 * cmean[1] + 0.0722 * cmean[2],
-            2,
-        )
 
     theme = "dark" if avg_brightness < 80.0 else "light"
 
@@ -521,71 +927,54 @@ def analyze_image(image_path: Path) -> Dict[str, object]:
     }
 
 
-def write_index_html(output_dir: Path, metadata: Dict[str, object]) -> None:
-    rows = []
-    for item in metadata["states"]:
-        analysis = item.get("analysis", {})
-        rows.append(
-            f"""
-            <tr>
-              <td>{item["name"]}</td>
-              <td><img src="{item["image"]}" alt="{item["name"]}"></td>
-              <td>{analysis.get("theme", "n/a")}</td>
-              <td>{analysis.get("avg_brightness", "n/a")}</td>
-              <td>{analysis.get("avg_rgb", "n/a")}</td>
-              <td>{item.get("action_status", "n/a")}</td>
-            </tr>
-            """
-        )
-
-    html = f"""<!DOCTYPE html>
+HTML_HEADER_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <title>Monument UI Capture Report</title>
   <style>
-    body {{
+    body {
       font-family: Arial, sans-serif;
       margin: 20px;
       background: #f6f6f6;
       color: #222;
-    }}
-    header {{
+    }
+    header {
       background: #111;
       color: #fff;
       padding: 12px 16px;
       border-radius: 8px;
-    }}
-    table {{
+    }
+    table {
       width: 100%;
       border-collapse: collapse;
       margin-top: 16px;
       background: #fff;
-    }}
-    th, td {{
+    }
+    th, td {
       border: 1px solid #ddd;
       padding: 10px;
       font-size: 13px;
       vertical-align: top;
-    }}
-    th {{
+    }
+    th {
       background: #f0f0f0;
       text-align: left;
-    }}
-    img {{
+    }
+    img {
       max-width: 320px;
       height: auto;
       border: 1px solid #ccc;
-    }}
+    }
   </style>
 </head>
 <body>
   <header>
     <h1>Monument UI Capture Report</h1>
     <div>
-      Generated: {metadata["generated_at"]}<br>
-      App: {metadata.get("app_path", "n/a")}<br>
-      Capture Mode: {metadata.get("capture_mode", "n/a")}
+      Generated: $generated_at<br>
+      App: $app_path<br>
+      Capture Mode: $capture_mode
     </div>
   </header>
   <table>
@@ -600,13 +989,59 @@ def write_index_html(output_dir: Path, metadata: Dict[str, object]) -> None:
       </tr>
     </thead>
     <tbody>
-      {''.join(rows)}
+      """)
+
+HTML_ROW_TEMPLATE = string.Template("""
+            <tr>
+              <td>$name</td>
+              <td><img src="$image" alt="$name"></td>
+              <td>$theme</td>
+              <td>$avg_brightness</td>
+              <td>$avg_rgb</td>
+              <td>$action_status</td>
+            </tr>
+            """)
+
+HTML_FOOTER = """
     </tbody>
   </table>
 </body>
 </html>
 """
-    (output_dir / "index.html").write_text(html, encoding="utf-8")
+
+
+def write_index_html(output_dir: Path, metadata: Dict[str, object]) -> None:
+    parts = [
+        HTML_HEADER_TEMPLATE.substitute(
+            generated_at=metadata["generated_at"],
+            app_path=metadata.get("app_path", "n/a"),
+            capture_mode=metadata.get("capture_mode", "n/a"),
+        )
+    ]
+    for item in metadata["states"]:
+        analysis = item.get("analysis") or {}
+        parts.append(
+            HTML_ROW_TEMPLATE.substitute(
+                name=item["name"],
+                image=item["image"],
+                theme=analysis.get("theme", "n/a"),
+                avg_brightness=analysis.get("avg_brightness", "n/a"),
+                avg_rgb=analysis.get("avg_rgb", "n/a"),
+                action_status=item.get("action_status", "n/a"),
+            )
+        )
+    parts.append(HTML_FOOTER)
+    (output_dir / "index.html").write_text("".join(parts), encoding="utf-8")
+
+
+def write_json(path: Path, data: Dict[str, object]) -> None:
+    """Serialise straight to the file, using orjson when it is installed."""
+    if orjson is not None:
+        with path.open("wb") as handle:
+            handle.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, ensure_ascii=False)
 
 
 def load_config(config_path: Path) -> Tuple[Optional[str], List[UIState]]:
@@ -630,7 +1065,7 @@ def load_config(config_path: Path) -> Tuple[Optional[str], List[UIState]]:
 def pick_capture_mode(requested: str) -> str:
     if requested != "auto":
         return requested
-    return "screencapture" if shutil.which("screencapture") else "pyautogui"
+    return "screencapture" if SCREENCAPTURE_BIN else "pyautogui"
 
 
 def main() -> int:
@@ -682,6 +1117,11 @@ def main() -> int:
         action="store_true",
         help="Skip launching the app (assumes it's already running).",
     )
+    parser.add_argument(
+        "--quit",
+        action="store_true",
+        help="Quit the app once all states are captured.",
+    )
     parser.add_argument(
         "--no-actions",
         action="store_true",
@@ -699,12 +1139,41 @@ def main() -> int:
         default="auto",
         help="Screen capture backend to use.",
     )
+    parser.add_argument(
+        "--region-capture",
+        action="store_true",
+        help="Capture the window's screen rectangle (screencapture -R) instead of the window "
+             "itself. Faster, but includes overlapping windows and is not pixel-comparable "
+             "with window captures; re-capture baselines with the same setting.",
+    )
     parser.add_argument(
         "--window-method",
         choices=["auto", "applescript", "cgwindow"],
         default=DEFAULT_WINDOW_METHOD,
         help="Window detection method for automated capture.",
     )
+    parser.add_argument(
+        "--poll-bounds",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Re-read window bounds every N states (default: 0, resolve once and reuse).",
+    )
+    parser.add_argument(
+        "--no-analysis",
+        action="store_true",
+        help="Skip image analysis (report columns show n/a).",
+    )
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="Only write screenshots and metadata.json (implies --no-analysis).",
+    )
+    parser.add_argument(
+        "--report-only",
+        action="store_true",
+        help="Rebuild index.html from an existing metadata.json without launching or capturing.",
+    )
     parser.add_argument(
         "--manual",
         action="store_true",
@@ -715,6 +1184,19 @@ def main() -> int:
     project_root = Path(__file__).resolve().parents[1]
     build_dir = resolve_build_dir(project_root, args.build_dir)
     output_dir = args.output_dir
+
+    if args.report_only:
+        # metadata.json already carries the analysis, so no PNG is opened here.
+        metadata_path = output_dir / "metadata.json"
+        try:
+            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"ERROR: Cannot read {metadata_path}: {exc}", file=sys.stderr)
+            return 2
+        write_index_html(output_dir, metadata)
+        print(f"Report: {output_dir / 'index.html'}")
+        return 0
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     config_path = args.config or os.environ.get("UI_CAPTURE_CONFIG")
@@ -741,15 +1223,27 @@ def main() -> int:
         return 2
 
     capture_mode = pick_capture_mode(args.capture_mode)
+    analyze = not (args.no_analysis or args.no_report)
 
     try:
-        if not args.skip_launch:
-            launch_app(app_path)
+        # Load frameworks/modules while `open` launches the app so the first
+        # window poll does not pay for them.
+        with ThreadPoolExecutor(max_workers=1) as warmup_pool:
+            warmup = warmup_pool.submit(warm_up, capture_mode, not args.manual, analyze)
+            if not args.skip_launch:
+                launch_app(app_path)
+            warmup.result()
+        button_index: Dict[str, int] = {}
         if args.manual:
             window_info = {}
         else:
             window_info = resolve_window_info(process_name, args.wait, args.window_method)
-            set_frontmost(process_name)
+            bounds, button_index = set_frontmost(
+                process_name,
+                list_buttons=not args.no_actions and any(state.label for state in states),
+            )
+            if bounds:
+                window_info = {**window_info, **bounds}
     except RuntimeError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         print("Ensure Accessibility permissions allow Terminal/Python to control the UI.", file=sys.stderr)
@@ -765,75 +1259,112 @@ def main() -> int:
         "states": [],
     }
 
-    click_window_info = window_info
-    if not args.manual and not args.no_actions:
-        if any(state.coords for state in states):
-            try:
-                click_window_info = get_window_info(process_name) or window_info
-            except RuntimeError:
-                click_window_info = window_info
-
-    for state in states:
-        action_status = "skipped"
-        if args.manual:
-            prompt = f"Set UI state '{state.name}'"
-            if state.label:
-                prompt += f" (label: {state.label})"
-            prompt += " and press Enter to capture..."
-            input(prompt)
-        elif state.label and not args.no_actions:
-            try:
-                clicked = click_button(process_name, state.label)
-            except RuntimeError:
-                clicked = False
-            if clicked:
-                action_status = "clicked_label"
-            elif state.coords:
-                if click_coords(click_window_info, state.coords):
-                    action_status = "clicked_coords"
+    # The window is resolved once and reused for every state. Click scripts
+    # report fresh bounds for free; a separate lookup only happens when the
+    # caller opts in with --poll-bounds.
+    pending_analysis: List[Tuple[Dict[str, object], Future]] = []
+    pending_writes: List[Future] = []
+    # PNG encoding and the NumPy reductions in analyze_pixels both release the
+    # GIL, so one small thread pool overlaps them with the next capture without
+    # pickling full-resolution screenshots to worker processes.
+    with ThreadPoolExecutor(max_workers=2) as background_pool:
+        for index, state in enumerate(states):
+            if not args.manual and args.poll_bounds > 0 and index > 0 and index % args.poll_bounds == 0:
+                window_info = refresh_window_info(process_name, window_info, args.window_method)
+
+            action_status = "skipped"
+            if args.manual:
+                prompt = f"Set UI state '{state.name}'"
+                if state.label:
+                    prompt += f" (label: {state.label})"
+                prompt += " and press Enter to capture..."
+                input(prompt)
+            elif state.label and not args.no_actions:
+                try:
+                    clicked, bounds = click_button(
+                        process_name, state.label, button_index.get(state.label)
+                    )
+                except RuntimeError:
+                    clicked, bounds = False, None
+                if bounds:
+                    window_info = {**window_info, **bounds}
+                if clicked:
+                    action_status = "clicked_label"
+                elif state.coords:
+                    if click_coords(window_info, state.coords):
+                        action_status = "clicked_coords"
+                    else:
+                        action_status = "missing_target"
                 else:
                     action_status = "missing_target"
-            else:
-                action_status = "missing_target"
 
-        if state.delay > 0:
-            time.sleep(state.delay)
+            if state.delay > 0:
+                time.sleep(state.delay)
 
-        image_name = f"{state.name}.png"
-        image_path = output_dir / image_name
-        try:
-            if args.manual:
-                capture_interactive(image_path)
-            else:
-                capture_window(capture_mode, window_info, image_path)
-        except RuntimeError as exc:
-            print(f"ERROR: {exc}", file=sys.stderr)
-            return 2
-
-        try:
-            analysis = analyze_image(image_path)
-        except RuntimeError as exc:
-            print(f"ERROR: {exc}", file=sys.stderr)
-            return 2
-
-        metadata["states"].append(
-            {
+            image_name = f"{state.name}.png"
+            image_path = output_dir / image_name
+            captured_pixels = None
+            try:
+                if args.manual:
+                    capture_interactive(image_path)
+                else:
+                    captured_image = capture_window(
+                        capture_mode, window_info, image_path, region=args.region_capture
+                    )
+                    if captured_image is not None:
+                        # PNG encoding releases the GIL; let it overlap the next state.
+                        # Level 1 is still lossless but several times cheaper than
+                        # zlib's default for full-window screenshots.
+                        pending_writes.append(background_pool.submit(
+                            captured_image.save, image_path, "PNG", compress_level=PNG_COMPRESS_LEVEL
+                        ))
+                        if analyze:
+                            captured_pixels = load_pixels(captured_image)
+            except RuntimeError as exc:
+                print(f"ERROR: {exc}", file=sys.stderr)
+                return 2
+
+            entry = {
                 "name": state.name,
                 "label": state.label,
                 "image": image_name,
                 "action_status": action_status,
-                "analysis": analysis,
+                "analysis": None if analyze else {},
             }
-        )
+            metadata["states"].append(entry)
+            if not analyze:
+                continue
+            # Analyse in the background while the next state is clicked and captured.
+            if captured_pixels is not None:
+                future = background_pool.submit(analyze_pixels, captured_pixels)
+            else:
+                future = background_pool.submit(analyze_image, image_path)
+            pending_analysis.append((entry, future))
 
-    (output_dir / "metadata.json").write_text(
-        json.dumps(metadata, indent=2, ensure_ascii=True),
-        encoding="utf-8",
-    )
-    write_index_html(output_dir, metadata)
+        for future in pending_writes:
+            try:
+                future.result()
+            except OSError as exc:
+                print(f"ERROR: {exc}", file=sys.stderr)
+                return 2
+
+        for entry, future in pending_analysis:
+            try:
+                entry["analysis"] = future.result()
+            except RuntimeError as exc:
+                print(f"ERROR: {exc}", file=sys.stderr)
+                return 2
+
+    if args.quit:
+        quit_app(process_name)
+
+    write_json(output_dir / "metadata.json", metadata)
+    if not args.no_report:
+        write_index_html(output_dir, metadata)
 
     print(f"Captured {len(states)} UI state(s) to {output_dir}")
-    print(f"Report: {output_dir / 'index.html'}")
+    if not args.no_report:
+        print(f"Report: {output_dir / 'index.html'}")
     return 0
 
 
@@ -12,17 +12,28 @@ Usage:
   python3 tools/check_audio_stability.py <audio_file.wav>
   python3 tools/check_audio_stability.py test-results/preset-0/wet.wav
   python3 tools/check_audio_stability.py test-results/preset-*/wet.wav  # Check all presets
+  python3 tools/check_audio_stability.py 'test-results/preset-*/wet.wav'  # Same, glob expanded here
 """
 
+import glob
+import os
 import sys
 import wave
 import struct
 import math
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
 import numpy as np
 
+try:
+    import soundfile as sf  # libsndfile: every PCM width plus IEEE float WAVs
+except ImportError:  # pragma: no cover - optional, falls back to the wave module
+    sf = None
+
 # ANSI color codes
 class Colors:
     GREEN = '\033[92m'
@@ -32,25 +43,116 @@ class Colors:
     BOLD = '\033[1m'
     RESET = '\033[0m'
 
-# Stability thresholds
-DENORMAL_THRESHOLD = 1e-38  # Values below this are considered denormals (FLT_MIN ≈ 1.175e-38)
-DC_OFFSET_THRESHOLD_DB = -60.0  # DC component should be < -60dB
-MAX_ALLOWED_NAN = 0  # Zero tolerance for NaN
-MAX_ALLOWED_INF = 0  # Zero tolerance for Inf
-MAX_ALLOWED_DENORMALS_PERCENT = 0.01  # Allow up to 0.01% denormals (tail samples)
+SILENCE_DB = -200.0  # Reported level for an exactly-zero value
+
+CHUNK_FRAMES = 1 << 20  # Frames decoded per block when streaming a file
+
+@dataclass(frozen=True)
+class StabilityConfig:
+    """Stability thresholds; pass a custom instance for stricter checks (e.g. master bus)."""
+    denormal_threshold: float = 1e-38  # Values below this are considered denormals (FLT_MIN ≈ 1.175e-38)
+    dc_offset_threshold_db: float = -60.0  # DC component should be < -60dB
+    max_allowed_nan: int = 0  # Zero tolerance for NaN
+    max_allowed_inf: int = 0  # Zero tolerance for Inf
+    max_allowed_denormals_percent: float = 0.01  # Allow up to 0.01% denormals (tail samples)
+
+DEFAULT_CONFIG = StabilityConfig()
 
 class AudioStats:
     """Statistics for audio stability analysis."""
+    # Plain __slots__ rather than @dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        'total_samples', 'nan_count', 'inf_count', 'denormal_count',
+        'dc_offset_db', 'rms_db', 'peak_db', 'denormal_percent', 'violations',
+    )
+
     def __init__(self):
-        self.total_samples = 0
-        self.nan_count = 0
-        self.inf_count = 0
-        self.denormal_count = 0
-        self.dc_offset_db = 0.0
-        self.rms_db = 0.0
-        self.peak_db = 0.0
-        self.denormal_percent = 0.0
-        self.violations = []
+        self.total_samples: int = 0
+        self.nan_count: int = 0
+        self.inf_count: int = 0
+        self.denormal_count: int = 0
+        self.dc_offset_db: float = 0.0
+        self.rms_db: float = 0.0
+        self.peak_db: float = 0.0
+        self.denormal_percent: float = 0.0
+        self.violations: List[str] = []
+
+def _to_db(value: float) -> float:
+    """Linear magnitude to dB; exact zero maps to SILENCE_DB instead of log(0)."""
+    if value <= 0.0:
+        return SILENCE_DB
+    return 20.0 * math.log10(value)
+
+def downmix(frames: np.ndarray) -> np.ndarray:
+    """Average (frames, channels) float32 data to mono in one pass."""
+    num_channels = frames.shape[1]
+    if num_channels == 1:
+        return frames[:, 0]
+    if num_channels == 2:
+        samples = frames[:, 0] + frames[:, 1]
+        samples *= np.float32(0.5)
+        return samples
+    samples = frames.sum(axis=1)
+    samples *= np.float32(1.0 / num_channels)
+    return samples
+
+def decode_frames(raw_data: bytes, sample_width: int, num_channels: int) -> np.ndarray:
+    """Convert interleaved PCM/float frames to a mono float32 array."""
+    # Convert to numpy array based on sample width
+    if sample_width == 2:  # 16-bit PCM
+        pcm = np.frombuffer(raw_data, dtype=np.int16)
+        scale = 1.0 / 32768.0
+    elif sample_width == 3:  # 24-bit PCM
+        # Assemble little-endian 24-bit triplets into int32, then sign-extend
+        raw = np.frombuffer(raw_data, dtype=np.uint8).reshape(-1, 3)
+        pcm = (
+            raw[:, 0].astype(np.int32)
+            | (raw[:, 1].astype(np.int32) << 8)
+            | (raw[:, 2].astype(np.int32) << 16)
+        )
+        pcm -= (pcm & 0x800000) << 1
+        scale = 1.0 / 8388608.0  # 2^23
+    elif sample_width == 4:  # 32-bit float or PCM
+        samples = np.frombuffer(raw_data, dtype=np.float32)
+        return downmix(samples.reshape(-1, num_channels))
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+
+    # Downmix integer PCM before scaling so no N-channel float32 copy is ever
+    # built: the channel sum is exact in int32 and is averaged by the scale.
+    if num_channels > 1:
+        pcm = pcm.reshape(-1, num_channels).sum(axis=1, dtype=np.int32)
+        scale /= num_channels
+
+    # Scale straight into the float32 output buffer instead of astype() + divide
+    samples = np.empty(len(pcm), dtype=np.float32)
+    np.multiply(pcm, np.float32(scale), out=samples, dtype=np.float32)
+    return samples
+
+def iter_audio_chunks(file_path: Path, frames_per_chunk: int = CHUNK_FRAMES) -> Iterator[np.ndarray]:
+    """
+    Yield the audio file as consecutive mono float32 blocks.
+
+    Only one block of raw and decoded data is resident at a time, so memory
+    use does not grow with the length of the render. libsndfile is used when
+    soundfile is installed; otherwise the stdlib wave module decodes PCM.
+    """
+    if sf is not None:
+        if not file_path.exists():
+            raise FileNotFoundError(file_path)
+        with sf.SoundFile(str(file_path)) as audio:
+            for frames in audio.blocks(blocksize=frames_per_chunk, dtype='float32', always_2d=True):
+                yield downmix(frames)
+        return
+
+    with wave.open(str(file_path), 'rb') as wf:
+        num_channels = wf.getnchannels()
+        sample_width = wf.getsampwidth()
+        while True:
+            raw_data = wf.readframes(frames_per_chunk)
+            if not raw_data:
+                break
+            yield decode_frames(raw_data, sample_width, num_channels)
 
 def load_audio_file(file_path: Path) -> Tuple[np.ndarray, int]:
     """
@@ -60,6 +162,10 @@ def load_audio_file(file_path: Path) -> Tuple[np.ndarray, int]:
         (samples, sample_rate) tuple where samples is float32 array
     """
     try:
+        if sf is not None:
+            frames, sample_rate = sf.read(str(file_path), dtype='float32', always_2d=True)
+            return downmix(frames), sample_rate
+
         with wave.open(str(file_path), 'rb') as wf:
             num_channels = wf.getnchannels()
             sample_width = wf.getsampwidth()
@@ -68,30 +174,7 @@ def load_audio_file(file_path: Path) -> Tuple[np.ndarray, int]:
 
             # Read raw audio data
             raw_data = wf.readframes(num_frames)
-
-            # Convert to numpy array based on sample width
-            if sample_width == 2:  # 16-bit PCM
-                samples = np.frombuffer(raw_data, dtype=np.int16)
-                samples = samples.astype(np.float32) / 32768.0
-            elif sample_width == 3:  # 24-bit PCM
-                # Unpack 24-bit samples manually
-                samples = []
-                for i in range(0, len(raw_data), 3):
-                    # Little-endian 24-bit signed
-                    val = int.from_bytes(raw_data[i:i+3], byteorder='little', signed=True)
-                    samples.append(val / 8388608.0)  # 2^23
-                samples = np.array(samples, dtype=np.float32)
-            elif sample_width == 4:  # 32-bit float or PCM
-                samples = np.frombuffer(raw_data, dtype=np.float32)
-            else:
-                raise ValueError(f"Unsupported sample width: {sample_width}")
-
-            # Handle multi-channel (interleaved)
-            if num_channels > 1:
-                samples = samples.reshape(-1, num_channels)
-                # Use L+R average for stereo analysis
-                samples = np.mean(samples, axis=1)
-
+            samples = decode_frames(raw_data, sample_width, num_channels)
             return samples, sample_rate
 
     except FileNotFoundError:
@@ -101,45 +184,98 @@ def load_audio_file(file_path: Path) -> Tuple[np.ndarray, int]:
         print(f"{Colors.RED}✗ Error loading audio file: {e}{Colors.RESET}")
         sys.exit(2)
 
-def analyze_audio_stability(samples: np.ndarray) -> AudioStats:
+def analyze_audio_chunks(
+    chunks: Iterable[np.ndarray],
+    config: StabilityConfig = DEFAULT_CONFIG,
+) -> AudioStats:
     """
-    Analyze audio samples for numerical stability issues.
+    Analyze a stream of mono sample blocks for numerical stability issues.
 
-    Checks for:
-    - NaN (Not a Number) values
-    - Inf (Infinity) values
-    - Denormal numbers (very small values)
-    - DC offset (bias away from zero)
+    Every statistic is a reduction, so it is accumulated block by block and
+    finalized once the stream is exhausted.
     """
     stats = AudioStats()
-    stats.total_samples = len(samples)
-
-    # Check for NaN
-    stats.nan_count = np.sum(np.isnan(samples))
-
-    # Check for Inf
-    stats.inf_count = np.sum(np.isinf(samples))
+    peak = 0.0
+    sum_x = 0.0
+    sum_x2 = 0.0
+    finite = True
+    # Scratch buffers reused for every block instead of fresh temporaries
+    abs_buffer = np.empty(0, dtype=np.float32)
+    mask = np.empty(0, dtype=bool)
+    nonzero = np.empty(0, dtype=bool)
+
+    for samples in chunks:
+        count = len(samples)
+        if count == 0:
+            continue
+        stats.total_samples += count
+        if len(abs_buffer) < count or abs_buffer.dtype != samples.dtype:
+            abs_buffer = np.empty(count, dtype=samples.dtype)
+            mask = np.empty(count, dtype=bool)
+            nonzero = np.empty(count, dtype=bool)
+
+        # Peak first: max() propagates NaN and keeps Inf, so a finite peak
+        # proves there is nothing to count and saves two passes over the block
+        abs_samples = np.abs(samples, out=abs_buffer[:count])
+        block_peak = float(np.max(abs_samples))
+        if not math.isfinite(block_peak):
+            stats.nan_count += np.count_nonzero(np.isnan(samples))
+            stats.inf_count += np.count_nonzero(np.isinf(samples))
+            finite = False
+
+        # Check for denormals (very small values)
+        below = np.less(abs_samples, config.denormal_threshold, out=mask[:count])
+        np.logical_and(below, np.not_equal(abs_samples, 0.0, out=nonzero[:count]), out=below)  # Exclude actual zeros
+        stats.denormal_count += np.count_nonzero(below)
+
+        # Once NaN/Inf has shown up the level statistics are meaningless, so
+        # stop paying for them and only keep counting violations
+        if not finite:
+            continue
+        peak = max(peak, block_peak)
+
+        # Running sums for DC offset and RMS, both accumulated in float64;
+        # einsum sums the squares without materialising samples ** 2 or a
+        # float64 copy of the chunk
+        sum_x += float(np.sum(samples, dtype=np.float64))
+        sum_x2 += float(np.einsum('i,i->', samples, samples, dtype=np.float64))
+
+    if stats.total_samples == 0:
+        raise ValueError("Audio file contains no samples")
 
-    # Check for denormals (very small values)
-    abs_samples = np.abs(samples)
-    non_zero_mask = abs_samples > 0.0  # Exclude actual zeros
-    stats.denormal_count = np.sum((abs_samples > 0.0) & (abs_samples < DENORMAL_THRESHOLD))
     stats.denormal_percent = (stats.denormal_count / stats.total_samples) * 100.0
 
+    if not finite:
+        stats.dc_offset_db = stats.rms_db = stats.peak_db = math.nan
+        return stats
+
     # Calculate DC offset
-    dc_offset = np.mean(samples)
-    dc_offset_linear = abs(dc_offset)
-    stats.dc_offset_db = 20.0 * math.log10(dc_offset_linear + 1e-10)  # Avoid log(0)
+    dc_offset = sum_x / stats.total_samples
+    stats.dc_offset_db = _to_db(abs(dc_offset))
 
     # Calculate RMS and peak (for context)
-    rms = np.sqrt(np.mean(samples ** 2))
-    stats.rms_db = 20.0 * math.log10(rms + 1e-10)
-    peak = np.max(abs_samples)
-    stats.peak_db = 20.0 * math.log10(peak + 1e-10)
+    rms = math.sqrt(sum_x2 / stats.total_samples)
+    stats.rms_db = _to_db(rms)
+    stats.peak_db = _to_db(peak)
 
     return stats
 
-def check_stability_thresholds(stats: AudioStats) -> bool:
+def analyze_audio_stability(
+    samples: np.ndarray,
+    config: StabilityConfig = DEFAULT_CONFIG,
+) -> AudioStats:
+    """
+    Analyze audio samples for numerical stability issues.
+
+    Checks for:
+    - NaN (Not a Number) values
+    - Inf (Infinity) values
+    - Denormal numbers (very small values)
+    - DC offset (bias away from zero)
+    """
+    return analyze_audio_chunks((samples,), config)
+
+def check_stability_thresholds(stats: AudioStats, config: StabilityConfig = DEFAULT_CONFIG) -> bool:
     """
     Check if audio meets stability requirements.
 
@@ -149,134 +285,208 @@ def check_stability_thresholds(stats: AudioStats) -> bool:
     all_passed = True
 
     # Check NaN
-    if stats.nan_count > MAX_ALLOWED_NAN:
+    if stats.nan_count > config.max_allowed_nan:
         stats.violations.append(f"NaN detected: {stats.nan_count} samples contain NaN")
         all_passed = False
 
     # Check Inf
-    if stats.inf_count > MAX_ALLOWED_INF:
+    if stats.inf_count > config.max_allowed_inf:
         stats.violations.append(f"Inf detected: {stats.inf_count} samples contain Inf")
         all_passed = False
 
     # Check denormals (allow small percentage for tail samples)
-    if stats.denormal_percent > MAX_ALLOWED_DENORMALS_PERCENT:
+    if stats.denormal_percent > config.max_allowed_denormals_percent:
         stats.violations.append(
             f"Excessive denormals: {stats.denormal_percent:.3f}% exceeds "
-            f"threshold {MAX_ALLOWED_DENORMALS_PERCENT:.3f}%"
+            f"threshold {config.max_allowed_denormals_percent:.3f}%"
         )
         all_passed = False
 
     # Check DC offset
-    if stats.dc_offset_db > DC_OFFSET_THRESHOLD_DB:
+    if stats.dc_offset_db > config.dc_offset_threshold_db:
         stats.violations.append(
             f"DC offset too high: {stats.dc_offset_db:.1f} dB exceeds "
-            f"threshold {DC_OFFSET_THRESHOLD_DB:.1f} dB"
+            f"threshold {config.dc_offset_threshold_db:.1f} dB"
         )
         all_passed = False
 
     return all_passed
 
-def print_results(file_path: Path, stats: AudioStats, passed: bool):
-    """Print stability check results."""
-    print(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
-    print(f"{Colors.BOLD}NUMERICAL STABILITY CHECK{Colors.RESET}")
-    print(f"{Colors.BOLD}{'=' * 80}{Colors.RESET}")
-
-    print(f"\n{Colors.BOLD}File: {file_path}{Colors.RESET}")
-    print(f"Total samples: {stats.total_samples:,}")
-    print(f"Duration: {stats.total_samples / 48000.0:.2f}s (@ 48kHz)")
-
-    print(f"\n{Colors.BOLD}Stability Checks:{Colors.RESET}")
-    print(f"{'Check':<30} {'Value':<20} {'Threshold':<20} {'Status':<10}")
-    print("-" * 90)
+def print_results(
+    file_path: Path,
+    stats: AudioStats,
+    passed: bool,
+    config: StabilityConfig = DEFAULT_CONFIG,
+):
+    """Print stability check results with a single write."""
+    lines: List[str] = []
+    lines.append(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+    lines.append(f"{Colors.BOLD}NUMERICAL STABILITY CHECK{Colors.RESET}")
+    lines.append(f"{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+
+    lines.append(f"\n{Colors.BOLD}File: {file_path}{Colors.RESET}")
+    lines.append(f"Total samples: {stats.total_samples:,}")
+    lines.append(f"Duration: {stats.total_samples / 48000.0:.2f}s (@ 48kHz)")
+
+    lines.append(f"\n{Colors.BOLD}Stability Checks:{Colors.RESET}")
+    lines.append(f"{'Check':<30} {'Value':<20} {'Threshold':<20} {'Status':<10}")
+    lines.append("-" * 90)
 
     # NaN check
     nan_status = f"{Colors.GREEN}✓ PASS{Colors.RESET}" if stats.nan_count == 0 else f"{Colors.RED}✗ FAIL{Colors.RESET}"
-    print(f"{'NaN samples':<30} {stats.nan_count:<20} {'= 0':<20} {nan_status}")
+    lines.append(f"{'NaN samples':<30} {stats.nan_count:<20} {'= 0':<20} {nan_status}")
 
     # Inf check
     inf_status = f"{Colors.GREEN}✓ PASS{Colors.RESET}" if stats.inf_count == 0 else f"{Colors.RED}✗ FAIL{Colors.RESET}"
-    print(f"{'Inf samples':<30} {stats.inf_count:<20} {'= 0':<20} {inf_status}")
+    lines.append(f"{'Inf samples':<30} {stats.inf_count:<20} {'= 0':<20} {inf_status}")
 
     # Denormal check
     denormal_status = (
         f"{Colors.GREEN}✓ PASS{Colors.RESET}"
-        if stats.denormal_percent <= MAX_ALLOWED_DENORMALS_PERCENT
+        if stats.denormal_percent <= config.max_allowed_denormals_percent
         else f"{Colors.RED}✗ FAIL{Colors.RESET}"
     )
-    print(f"{'Denormal samples':<30} "
+    lines.append(f"{'Denormal samples':<30} "
           f"{f'{stats.denormal_count} ({stats.denormal_percent:.3f}%)':<20} "
-          f"{f'<= {MAX_ALLOWED_DENORMALS_PERCENT:.3f}%':<20} {denormal_status}")
+          f"{f'<= {config.max_allowed_denormals_percent:.3f}%':<20} {denormal_status}")
 
-    # DC offset check
-    dc_status = (
-        f"{Colors.GREEN}✓ PASS{Colors.RESET}"
-        if stats.dc_offset_db <= DC_OFFSET_THRESHOLD_DB
-        else f"{Colors.RED}✗ FAIL{Colors.RESET}"
-    )
-    print(f"{'DC offset':<30} {f'{stats.dc_offset_db:.1f} dB':<20} "
-          f"{f'<= {DC_OFFSET_THRESHOLD_DB:.1f} dB':<20} {dc_status}")
+    # DC offset check (undefined once NaN/Inf is present; those rows fail instead)
+    if math.isnan(stats.dc_offset_db):
+        dc_value = "N/A"
+        dc_status = f"{Colors.BLUE}○ N/A{Colors.RESET}"
+    else:
+        dc_value = f"{stats.dc_offset_db:.1f} dB"
+        dc_status = (
+            f"{Colors.GREEN}✓ PASS{Colors.RESET}"
+            if stats.dc_offset_db <= config.dc_offset_threshold_db
+            else f"{Colors.RED}✗ FAIL{Colors.RESET}"
+        )
+    lines.append(f"{'DC offset':<30} {dc_value:<20} "
+          f"{f'<= {config.dc_offset_threshold_db:.1f} dB':<20} {dc_status}")
 
-    print(f"\n{Colors.BOLD}Audio Statistics (informational):{Colors.RESET}")
-    print(f"  RMS level: {stats.rms_db:.1f} dB")
-    print(f"  Peak level: {stats.peak_db:.1f} dB")
+    lines.append(f"\n{Colors.BOLD}Audio Statistics (informational):{Colors.RESET}")
+    lines.append(f"  RMS level: {stats.rms_db:.1f} dB")
+    lines.append(f"  Peak level: {stats.peak_db:.1f} dB")
 
     if passed:
-        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ ALL STABILITY CHECKS PASSED{Colors.RESET}")
-        print(f"{Colors.GREEN}Audio output is numerically stable.{Colors.RESET}")
+        lines.append(f"\n{Colors.GREEN}{Colors.BOLD}✓ ALL STABILITY CHECKS PASSED{Colors.RESET}")
+        lines.append(f"{Colors.GREEN}Audio output is numerically stable.{Colors.RESET}")
     else:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ STABILITY VIOLATIONS DETECTED{Colors.RESET}")
-        print(f"\n{Colors.RED}Violations ({len(stats.violations)}):{Colors.RESET}")
+        lines.append(f"\n{Colors.RED}{Colors.BOLD}✗ STABILITY VIOLATIONS DETECTED{Colors.RESET}")
+        lines.append(f"\n{Colors.RED}Violations ({len(stats.violations)}):{Colors.RESET}")
         for i, violation in enumerate(stats.violations, 1):
-            print(f"  {i}. {violation}")
+            lines.append(f"  {i}. {violation}")
 
-        print(f"\n{Colors.YELLOW}Recommended Actions:{Colors.RESET}")
+        lines.append(f"\n{Colors.YELLOW}Recommended Actions:{Colors.RESET}")
         if stats.nan_count > 0:
-            print(f"  - NaN indicates division by zero or invalid math operations")
-            print(f"  - Check filter coefficient calculations")
-            print(f"  - Verify parameter range validation")
+            lines.append(f"  - NaN indicates division by zero or invalid math operations")
+            lines.append(f"  - Check filter coefficient calculations")
+            lines.append(f"  - Verify parameter range validation")
         if stats.inf_count > 0:
-            print(f"  - Inf indicates overflow or division by very small number")
-            print(f"  - Add safety clamps to gain stages")
-            print(f"  - Check feedback loop stability")
-        if stats.denormal_percent > MAX_ALLOWED_DENORMALS_PERCENT:
-            print(f"  - Denormals degrade CPU performance significantly")
-            print(f"  - Use juce::ScopedNoDenormals in processBlock")
-            print(f"  - Add DC blocker if needed")
-        if stats.dc_offset_db > DC_OFFSET_THRESHOLD_DB:
-            print(f"  - DC offset can cause clicks and pops")
-            print(f"  - Add high-pass filter (1-5 Hz cutoff)")
-            print(f"  - Check for uninitialized state variables")
-
-    print(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+            lines.append(f"  - Inf indicates overflow or division by very small number")
+            lines.append(f"  - Add safety clamps to gain stages")
+            lines.append(f"  - Check feedback loop stability")
+        if stats.denormal_percent > config.max_allowed_denormals_percent:
+            lines.append(f"  - Denormals degrade CPU performance significantly")
+            lines.append(f"  - Use juce::ScopedNoDenormals in processBlock")
+            lines.append(f"  - Add DC blocker if needed")
+        if stats.dc_offset_db > config.dc_offset_threshold_db:
+            lines.append(f"  - DC offset can cause clicks and pops")
+            lines.append(f"  - Add high-pass filter (1-5 Hz cutoff)")
+            lines.append(f"  - Check for uninitialized state variables")
+
+    lines.append(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def check_file(file_path: Path, config: StabilityConfig = DEFAULT_CONFIG) -> Tuple[AudioStats, bool]:
+    """Stream, analyze and threshold one file (runs in a worker process)."""
+    stats = analyze_audio_chunks(iter_audio_chunks(file_path), config)
+    return stats, check_stability_thresholds(stats, config)
+
+def expand_paths(args: List[str]) -> List[Path]:
+    """Resolve command-line arguments, expanding glob patterns the shell left alone."""
+    paths = []
+    for arg in args:
+        if glob.has_magic(arg) and not Path(arg).exists():
+            paths.extend(Path(match) for match in sorted(glob.glob(arg)))
+        else:
+            paths.append(Path(arg))
+    return paths
+
+def print_error(file_path: Path, error: BaseException):
+    if isinstance(error, FileNotFoundError):
+        print(f"{Colors.RED}✗ Error: Audio file not found: {file_path}{Colors.RESET}")
+    else:
+        print(f"{Colors.RED}✗ Error loading audio file: {error}{Colors.RESET}")
 
 def main():
     """Main entry point for audio stability checker."""
-    if len(sys.argv) != 2:
-        print(f"{Colors.RED}Usage: python3 {sys.argv[0]} <audio_file.wav>{Colors.RESET}")
+    if len(sys.argv) < 2:
+        print(f"{Colors.RED}Usage: python3 {sys.argv[0]} <audio_file.wav> [more.wav ...]{Colors.RESET}")
         print(f"\nExample:")
         print(f"  python3 {sys.argv[0]} test-results/preset-0/wet.wav")
+        print(f"  python3 {sys.argv[0]} 'test-results/preset-*/wet.wav'")
         sys.exit(2)
 
-    file_path = Path(sys.argv[1])
+    file_paths = expand_paths(sys.argv[1:])
+    if not file_paths:
+        print(f"{Colors.RED}✗ Error: No audio files match {' '.join(sys.argv[1:])}{Colors.RESET}")
+        sys.exit(2)
 
     print(f"{Colors.BOLD}Monument Reverb - Audio Stability Checker{Colors.RESET}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Load audio file
-    samples, sample_rate = load_audio_file(file_path)
-
-    # Analyze stability
-    stats = analyze_audio_stability(samples)
-
-    # Check thresholds
-    passed = check_stability_thresholds(stats)
-
-    # Print results
-    print_results(file_path, stats, passed)
+    # Files are independent, so analyze them in parallel; workers open their
+    # own file and only the small AudioStats comes back. Results are printed
+    # in argument order.
+    outcomes: List[Tuple[Path, object]] = []
+    if len(file_paths) == 1:
+        try:
+            outcomes.append((file_paths[0], check_file(file_paths[0])))
+        except Exception as e:
+            outcomes.append((file_paths[0], e))
+    else:
+        try:
+            workers = min(len(file_paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(check_file, path) for path in file_paths]
+                for path, future in zip(file_paths, futures):
+                    try:
+                        outcomes.append((path, future.result()))
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        outcomes.append((path, e))
+        except (OSError, BrokenProcessPool):
+            # Process pools are unavailable in some sandboxes; check serially
+            outcomes = []
+            for path in file_paths:
+                try:
+                    outcomes.append((path, check_file(path)))
+                except Exception as e:
+                    outcomes.append((path, e))
+
+    exit_code = 0
+    failed = 0
+    for file_path, outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            print_error(file_path, outcome)
+            exit_code = 2
+            failed += 1
+            continue
+        stats, passed = outcome
+        print_results(file_path, stats, passed)
+        if not passed:
+            exit_code = max(exit_code, 1)
+            failed += 1
+
+    if len(outcomes) > 1:
+        color = Colors.GREEN if failed == 0 else Colors.RED
+        print(f"\n{color}{Colors.BOLD}Summary: {failed}/{len(outcomes)} files failed{Colors.RESET}")
 
     # Exit with appropriate code
-    sys.exit(0 if passed else 1)
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
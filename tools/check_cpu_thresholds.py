@@ -19,6 +19,11 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional; json is used instead
+    orjson = None
+
 # ANSI color codes for output formatting
 class Colors:
     GREEN = '\033[92m'
@@ -35,9 +40,21 @@ CPU_THRESHOLDS = {
     "MemoryEchoes": 15.0,   # Max 15% CPU
 }
 
+# Top-level keys every CPU profile must have
+REQUIRED_FIELDS = frozenset({"version", "timestamp", "module_breakdown", "estimated_cpu_load_percent"})
+
 # Overall plugin threshold @ 512 samples/block, 48kHz
 OVERALL_THRESHOLD_PERCENT = 10.0  # Max 10% CPU
 
+# Report fragments that do not depend on the profile, built once
+STATUS_PASS = f"{Colors.GREEN}✓ PASS{Colors.RESET}"
+STATUS_FAIL = f"{Colors.RED}✗ FAIL{Colors.RESET}"
+STATUS_NA = f"{Colors.BLUE}○ N/A{Colors.RESET}"
+MODULE_ROW_FMT = "{:<20} {:<10.1f} {:<12} {}"
+MODULE_THRESHOLD_LABELS = [f"<= {threshold:.1f}%" for threshold in CPU_THRESHOLDS.values()]
+OVERALL_ROW_FMT = "{:<30} {:<15} {:<15} {}"
+OVERALL_THRESHOLD_LABEL = f"<= {OVERALL_THRESHOLD_PERCENT:.1f}%"
+
 def load_cpu_profile(profile_path: Path) -> Dict:
     """Load and validate CPU profile JSON."""
     if not profile_path.exists():
@@ -45,15 +62,18 @@ def load_cpu_profile(profile_path: Path) -> Dict:
         sys.exit(2)
 
     try:
-        with open(profile_path, 'r') as f:
-            data = json.load(f)
-
-        # Validate required fields
-        required_fields = ["version", "timestamp", "module_breakdown", "estimated_cpu_load_percent"]
-        for field in required_fields:
-            if field not in data:
-                print(f"{Colors.RED}✗ Error: Missing required field '{field}' in profile{Colors.RESET}")
-                sys.exit(2)
+        with open(profile_path, 'rb') as f:
+            raw = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+        # handler below covers both parsers.
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        # Validate required fields, reporting every missing one at once
+        missing = REQUIRED_FIELDS - (data.keys() if isinstance(data, dict) else set())
+        if missing:
+            fields = ", ".join(f"'{field}'" for field in sorted(missing))
+            print(f"{Colors.RED}✗ Error: Missing required field(s) {fields} in profile{Colors.RESET}")
+            sys.exit(2)
 
         return data
 
@@ -74,37 +94,38 @@ def check_module_thresholds(module_breakdown: Dict[str, Dict]) -> Tuple[bool, Li
     violations = []
     all_passed = True
 
-    print(f"\n{Colors.BOLD}Module CPU Usage:{Colors.RESET}")
-    print(f"{'Module':<20} {'CPU %':<10} {'Threshold':<12} {'Status':<10}")
-    print("-" * 60)
+    lines = []
+    lines.append(f"\n{Colors.BOLD}Module CPU Usage:{Colors.RESET}")
+    lines.append(f"{'Module':<20} {'CPU %':<10} {'Threshold':<12} {'Status':<10}")
+    lines.append("-" * 60)
 
     # Check each module that has a threshold
-    for module_name, threshold in CPU_THRESHOLDS.items():
+    for (module_name, threshold), threshold_label in zip(CPU_THRESHOLDS.items(), MODULE_THRESHOLD_LABELS):
         if module_name in module_breakdown:
-            module_data = module_breakdown[module_name]
-            cpu_percent = module_data.get("percent_of_total", 0.0)
+            cpu_percent = module_breakdown[module_name].get("percent_of_total", 0.0)
 
             if cpu_percent > threshold:
-                status = f"{Colors.RED}✗ FAIL{Colors.RESET}"
-                violation_msg = f"{module_name}: {cpu_percent:.1f}% exceeds threshold {threshold:.1f}%"
-                violations.append(violation_msg)
+                status = STATUS_FAIL
+                violations.append(f"{module_name}: {cpu_percent:.1f}% exceeds threshold {threshold:.1f}%")
                 all_passed = False
             else:
-                status = f"{Colors.GREEN}✓ PASS{Colors.RESET}"
-
-            print(f"{module_name:<20} {cpu_percent:<10.1f} {f'<= {threshold:.1f}%':<12} {status}")
+                status = STATUS_PASS
         else:
             # Module not present in profile (0% CPU)
-            status = f"{Colors.BLUE}○ N/A{Colors.RESET}"
-            print(f"{module_name:<20} {0.0:<10.1f} {f'<= {threshold:.1f}%':<12} {status}")
+            cpu_percent = 0.0
+            status = STATUS_NA
+
+        lines.append(MODULE_ROW_FMT.format(module_name, cpu_percent, threshold_label, status))
 
     # Report other modules without thresholds (informational)
     other_modules = set(module_breakdown.keys()) - set(CPU_THRESHOLDS.keys())
     if other_modules:
-        print(f"\n{Colors.BOLD}Other Modules (informational):{Colors.RESET}")
+        lines.append(f"\n{Colors.BOLD}Other Modules (informational):{Colors.RESET}")
         for module_name in sorted(other_modules):
             cpu_percent = module_breakdown[module_name].get("percent_of_total", 0.0)
-            print(f"{module_name:<20} {cpu_percent:<10.1f}")
+            lines.append(f"{module_name:<20} {cpu_percent:<10.1f}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return all_passed, violations
 
@@ -116,71 +137,76 @@ def check_overall_threshold(estimated_cpu_percent: float) -> Tuple[bool, List[st
         (passed, violations) tuple
     """
     violations = []
+    lines = []
 
-    print(f"\n{Colors.BOLD}Overall Plugin CPU Usage:{Colors.RESET}")
-    print(f"{'Metric':<30} {'Value':<15} {'Threshold':<15} {'Status':<10}")
-    print("-" * 80)
+    lines.append(f"\n{Colors.BOLD}Overall Plugin CPU Usage:{Colors.RESET}")
+    lines.append(f"{'Metric':<30} {'Value':<15} {'Threshold':<15} {'Status':<10}")
+    lines.append("-" * 80)
 
     if estimated_cpu_percent > OVERALL_THRESHOLD_PERCENT:
-        status = f"{Colors.RED}✗ FAIL{Colors.RESET}"
+        status = STATUS_FAIL
         violation_msg = f"Overall CPU: {estimated_cpu_percent:.2f}% exceeds threshold {OVERALL_THRESHOLD_PERCENT:.1f}%"
         violations.append(violation_msg)
         passed = False
     else:
-        status = f"{Colors.GREEN}✓ PASS{Colors.RESET}"
+        status = STATUS_PASS
         passed = True
 
-    print(f"{'Estimated CPU @ 512/48kHz':<30} {f'{estimated_cpu_percent:.2f}%':<15} "
-          f"{f'<= {OVERALL_THRESHOLD_PERCENT:.1f}%':<15} {status}")
+    lines.append(OVERALL_ROW_FMT.format(
+        'Estimated CPU @ 512/48kHz', f'{estimated_cpu_percent:.2f}%', OVERALL_THRESHOLD_LABEL, status
+    ))
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return passed, violations
 
 def print_summary(all_passed: bool, all_violations: List[str], profile_path: Path, profile_data: Dict):
     """Print summary of threshold checks."""
-    print(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
-    print(f"{Colors.BOLD}CPU THRESHOLD CHECK SUMMARY{Colors.RESET}")
-    print(f"{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+    lines = []
+    lines.append(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+    lines.append(f"{Colors.BOLD}CPU THRESHOLD CHECK SUMMARY{Colors.RESET}")
+    lines.append(f"{Colors.BOLD}{'=' * 80}{Colors.RESET}")
 
-    print(f"\n{Colors.BOLD}Profile Information:{Colors.RESET}")
-    print(f"  File: {profile_path}")
-    print(f"  Version: {profile_data.get('version', 'unknown')}")
-    print(f"  Timestamp: {profile_data.get('timestamp', 'unknown')}")
-    print(f"  Duration: {profile_data.get('profile_duration_seconds', 0):.1f}s")
+    lines.append(f"\n{Colors.BOLD}Profile Information:{Colors.RESET}")
+    lines.append(f"  File: {profile_path}")
+    lines.append(f"  Version: {profile_data.get('version', 'unknown')}")
+    lines.append(f"  Timestamp: {profile_data.get('timestamp', 'unknown')}")
+    lines.append(f"  Duration: {profile_data.get('profile_duration_seconds', 0):.1f}s")
 
     if all_passed:
-        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ ALL THRESHOLDS PASSED{Colors.RESET}")
-        print(f"{Colors.GREEN}No CPU performance violations detected.{Colors.RESET}")
+        lines.append(f"\n{Colors.GREEN}{Colors.BOLD}✓ ALL THRESHOLDS PASSED{Colors.RESET}")
+        lines.append(f"{Colors.GREEN}No CPU performance violations detected.{Colors.RESET}")
     else:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ THRESHOLD VIOLATIONS DETECTED{Colors.RESET}")
-        print(f"\n{Colors.RED}Violations ({len(all_violations)}):{Colors.RESET}")
+        lines.append(f"\n{Colors.RED}{Colors.BOLD}✗ THRESHOLD VIOLATIONS DETECTED{Colors.RESET}")
+        lines.append(f"\n{Colors.RED}Violations ({len(all_violations)}):{Colors.RESET}")
         for i, violation in enumerate(all_violations, 1):
-            print(f"  {i}. {violation}")
+            lines.append(f"  {i}. {violation}")
 
-        print(f"\n{Colors.YELLOW}Recommended Actions:{Colors.RESET}")
-        print(f"  1. Profile the specific modules that exceeded thresholds")
-        print(f"  2. Look for optimization opportunities (SIMD, caching, etc.)")
-        print(f"  3. Consider reducing algorithmic complexity")
-        print(f"  4. Review parameter ranges that trigger high CPU usage")
+        lines.append(f"\n{Colors.YELLOW}Recommended Actions:{Colors.RESET}")
+        lines.append(f"  1. Profile the specific modules that exceeded thresholds")
+        lines.append(f"  2. Look for optimization opportunities (SIMD, caching, etc.)")
+        lines.append(f"  3. Consider reducing algorithmic complexity")
+        lines.append(f"  4. Review parameter ranges that trigger high CPU usage")
 
         # Provide module-specific recommendations
         for violation in all_violations:
             if "TubeRayTracer" in violation:
-                print(f"\n{Colors.YELLOW}TubeRayTracer optimization ideas:{Colors.RESET}")
-                print(f"  - Vectorize ray intersection tests with SIMD")
-                print(f"  - Reduce ray count or bounces per sample")
-                print(f"  - Pre-compute geometry acceleration structures")
+                lines.append(f"\n{Colors.YELLOW}TubeRayTracer optimization ideas:{Colors.RESET}")
+                lines.append(f"  - Vectorize ray intersection tests with SIMD")
+                lines.append(f"  - Reduce ray count or bounces per sample")
+                lines.append(f"  - Pre-compute geometry acceleration structures")
             elif "Chambers" in violation:
-                print(f"\n{Colors.YELLOW}Chambers optimization ideas:{Colors.RESET}")
-                print(f"  - Vectorize 8×8 matrix multiplication")
-                print(f"  - Reduce allpass filter chain length")
-                print(f"  - Cache frequently-used filter coefficients")
+                lines.append(f"\n{Colors.YELLOW}Chambers optimization ideas:{Colors.RESET}")
+                lines.append(f"  - Vectorize 8×8 matrix multiplication")
+                lines.append(f"  - Reduce allpass filter chain length")
+                lines.append(f"  - Cache frequently-used filter coefficients")
             elif "MemoryEchoes" in violation:
-                print(f"\n{Colors.YELLOW}MemoryEchoes optimization ideas:{Colors.RESET}")
-                print(f"  - Optimize delay line access patterns")
-                print(f"  - Use SIMD for multi-tap processing")
-                print(f"  - Reduce interpolation complexity")
+                lines.append(f"\n{Colors.YELLOW}MemoryEchoes optimization ideas:{Colors.RESET}")
+                lines.append(f"  - Optimize delay line access patterns")
+                lines.append(f"  - Use SIMD for multi-tap processing")
+                lines.append(f"  - Reduce interpolation complexity")
 
-    print(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+    lines.append(f"\n{Colors.BOLD}{'=' * 80}{Colors.RESET}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main entry point for CPU threshold checker."""
@@ -9,87 +9,444 @@ Usage:
     python3 compare_baseline.py <baseline_dir> <current_dir> [--threshold 0.1]
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# numpy and scipy.io.wavfile are imported by load_dependencies() on first
+# use, so --help and argument errors do not pay their import time.
+np = None
+wavfile = None
 
 try:
-    import numpy as np
-    from scipy.io import wavfile
-    from scipy import signal
-except ImportError as e:
-    print(f"Error: Missing required Python package: {e}")
-    print("\nInstall dependencies:")
-    print("  pip3 install numpy scipy")
-    sys.exit(1)
+    import orjson
+except ImportError:  # optional; json is used instead
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; files are parsed whole and then flattened
+    ijson = None
 
 
 DEFAULT_SPATIAL_ITD_MS = 0.2
 DEFAULT_SPATIAL_ILD_DB = 1.0
 DEFAULT_SPATIAL_IACC_DELTA = 0.05
 
-
-def load_metrics(preset_dir: Path) -> Dict:
-    """Load RT60, frequency response, and spatial metrics for a preset."""
+# The only leaves the compare_* functions read, as dotted paths. Metric files
+# are reduced to flat {path: value} dicts so nothing else is kept in memory.
+METRIC_KEYS = frozenset({
+    'rt60_seconds',
+    'broadband.rt60_seconds',
+    'broadband.flatness_db',
+    'overall.flatness_std_db',
+    'broadband.itd_seconds',
+    'broadband.ild_db',
+    'broadband.iacc',
+})
+METRIC_FILES = (
+    ('rt60', 'rt60_metrics.json'),
+    ('freq_response', 'freq_metrics.json'),
+    ('spatial', 'spatial_metrics.json'),
+)
+PRESET_INPUT_FILES = tuple(filename for _, filename in METRIC_FILES) + ('wet.wav',)
+COMPARE_CACHE_FILENAME = '.compare_cache.json'
+_CONTAINER_EVENTS = frozenset({'start_map', 'end_map', 'start_array', 'end_array', 'map_key'})
+
+# Welch PSD settings, matching scipy.signal.welch defaults at nperseg=2048:
+# periodic Hann window, 50% overlap, per-segment mean removal.
+WELCH_NPERSEG = 2048
+
+
+@functools.lru_cache(maxsize=8)
+def _hann(n: int) -> np.ndarray:
+    """Periodic Hann window (scipy.signal.get_window('hann', n))."""
+    window = (0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(n) / n)).astype(np.float32)
+    window.setflags(write=False)
+    return window
+
+
+@functools.lru_cache(maxsize=8)
+def _psd_scale(nperseg: int, sample_rate: int) -> np.ndarray:
+    """Per-bin factor turning summed |rfft|^2 into a one-sided PSD density.
+
+    Folds the window power, the sample rate and the doubling of the non-DC,
+    non-Nyquist bins into one vector per (nperseg, sample_rate).
+    """
+    window = _hann(nperseg)
+    scale = np.full(nperseg // 2 + 1, 1.0 / (sample_rate * np.dot(window, window)))
+    if nperseg % 2:
+        scale[1:] *= 2
+    else:
+        scale[1:-1] *= 2
+    scale.setflags(write=False)
+    return scale
+
+
+# Welch segments converted per block when streaming a WAV pair; 256 segments
+# at nperseg=2048 is about 1 MiB of float32 mono per signal.
+WAVEFORM_BLOCK_SEGMENTS = 256
+
+class WaveformScratch:
+    """Grow-only work buffers for compare_waveforms.
+
+    Blocks are the same size for every preset, so one set of buffers per
+    process is reused across blocks and across presets instead of being
+    reallocated each time.
+    """
+
+    __slots__ = ('_buffers',)
+
+    def __init__(self):
+        self._buffers: Dict[Tuple[str, np.dtype], np.ndarray] = {}
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """Return an uninitialised array of `shape` backed by the named buffer."""
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        buffer = self._buffers.get((name, dtype))
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[(name, dtype)] = buffer
+        return buffer[:size].reshape(shape)
+
+
+_SCRATCH = WaveformScratch()
+
+
+def load_dependencies() -> None:
+    """Import numpy and scipy.io.wavfile, exiting with install hints if missing."""
+    global np, wavfile
+    if wavfile is not None:
+        return
+    try:
+        import numpy as np
+        from scipy.io import wavfile
+    except ImportError as e:
+        print(f"Error: Missing required Python package: {e}")
+        print("\nInstall dependencies:")
+        print("  pip3 install numpy scipy")
+        sys.exit(1)
+
+
+@functools.lru_cache(maxsize=1)
+def _rfft_has_out() -> bool:
+    """np.fft.rfft accepts out= from NumPy 2.0."""
+    return np.lib.NumpyVersion(np.__version__) >= '2.0.0'
+
+
+@functools.lru_cache(maxsize=1)
+def _decoder() -> ThreadPoolExecutor:
+    """Thread that decodes the baseline WAV while the caller decodes the current one.
+
+    NumPy releases the GIL in the conversion loops and mapped pages fault in
+    outside it, so the two files' I/O and casts overlap.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='wav-decode')
+
+
+def load_json(path: Path) -> Dict:
+    """Parse a JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, data: Dict) -> None:
+    """Serialise a report, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_metric_values(path_str: str, mtime_ns: int) -> Optional[Dict]:
+    """load_metric_values keyed on (path, mtime) so edited files are re-read."""
+    return load_metric_values(Path(path_str))
+
+
+def load_metric_values(path: Path) -> Optional[Dict]:
+    """Extract the METRIC_KEYS leaves of a metrics file as a flat dict.
+
+    Returns None for an empty document so callers can skip the comparison,
+    as they would for a missing file.
+    """
+    values = {}
+    if ijson is not None:
+        has_keys = False
+        with open(path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if event == 'map_key' and not prefix:
+                    has_keys = True
+                elif prefix in METRIC_KEYS and event not in _CONTAINER_EVENTS:
+                    values[prefix] = value
+        return values if has_keys else None
+
+    data = load_json(path)
+    if not data:
+        return None
+    for key in METRIC_KEYS:
+        node = data
+        for part in key.split('.'):
+            node = node.get(part) if isinstance(node, dict) else None
+        if node is not None:
+            values[key] = node
+    return values
+
+
+def scan_preset_dir(preset_dir: Path) -> Optional[Dict[str, os.DirEntry]]:
+    """List a preset directory once, or return None if it does not exist."""
+    try:
+        with os.scandir(preset_dir) as entries:
+            return {entry.name: entry for entry in entries}
+    except FileNotFoundError:
+        return None
+    except NotADirectoryError:
+        return {}
+
+
+def load_metrics(preset_dir: Path, entries: Optional[Dict[str, os.DirEntry]] = None) -> Dict:
+    """Load RT60, frequency response, and spatial metrics for a preset.
+
+    `entries` is the directory listing from scan_preset_dir, if the caller
+    already has it. Parsed files are memoised for the rest of the run; the
+    returned dicts are shared and must not be modified.
+    """
+    if entries is None:
+        entries = scan_preset_dir(preset_dir) or {}
     metrics = {}
 
-    rt60_file = preset_dir / "rt60_metrics.json"
-    if rt60_file.exists():
-        with open(rt60_file) as f:
-            metrics['rt60'] = json.load(f)
+    for key, filename in METRIC_FILES:
+        entry = entries.get(filename)
+        if entry is not None:
+            metrics[key] = _cached_metric_values(entry.path, entry.stat().st_mtime_ns)
 
-    freq_file = preset_dir / "freq_metrics.json"
-    if freq_file.exists():
-        with open(freq_file) as f:
-            metrics['freq_response'] = json.load(f)
+    return metrics
 
-    spatial_file = preset_dir / "spatial_metrics.json"
-    if spatial_file.exists():
-        with open(spatial_file) as f:
-            metrics['spatial'] = json.load(f)
 
-    return metrics
+def _to_mono_float(audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Downmix to mono and scale to float32 full scale (/32768)."""
+    if audio.ndim > 1:
+        mono = audio.mean(axis=1, dtype=np.float32, out=out)
+    elif out is not None:
+        mono = out
+        np.copyto(mono, audio)
+    else:
+        mono = audio.astype(np.float32)
+    return np.multiply(mono, np.float32(1.0 / 32768.0), out=mono)
 
 
-def compare_waveforms(baseline_wav: Path, current_wav: Path) -> Dict:
-    """Compare two waveform files and return similarity metrics."""
-    # Load both files
-    sr_baseline, audio_baseline = wavfile.read(baseline_wav)
-    sr_current, audio_current = wavfile.read(current_wav)
+class CorrelationSums:
+    """Running sums for Pearson correlation and RMS difference of two signals.
 
-    if sr_baseline != sr_current:
-        return {'error': 'Sample rate mismatch'}
+    Samples are offset by a shift (the first block's means) before summing in
+    float64, which keeps the one-pass variance formula well conditioned.
+    """
+    __slots__ = (
+        'shift_a', 'shift_b', 'count',
+        'sum_a', 'sum_b', 'sum_aa', 'sum_bb', 'sum_ab', 'sum_dd',
+    )
 
-    # Convert to float and normalize
-    audio_baseline = audio_baseline.astype(np.float32) / 32768.0
-    audio_current = audio_current.astype(np.float32) / 32768.0
+    def __init__(self, shift_a: float, shift_b: float):
+        self.shift_a = shift_a
+        self.shift_b = shift_b
+        self.count = 0
+        self.sum_a = 0.0
+        self.sum_b = 0.0
+        self.sum_aa = 0.0
+        self.sum_bb = 0.0
+        self.sum_ab = 0.0
+        self.sum_dd = 0.0
+
+    def add(self, a: np.ndarray, b: np.ndarray) -> None:
+        x = np.subtract(a, self.shift_a, dtype=np.float64)
+        y = np.subtract(b, self.shift_b, dtype=np.float64)
+        self.count += len(x)
+        self.sum_a += x.sum()
+        self.sum_b += y.sum()
+        self.sum_aa += np.dot(x, x)
+        self.sum_bb += np.dot(y, y)
+        self.sum_ab += np.dot(x, y)
+        d = np.subtract(x, y, out=x)
+        self.sum_dd += np.dot(d, d)
+
+    def finish(self) -> Tuple[float, float]:
+        """Return (correlation, rms_difference)."""
+        n = self.count
+        covariance = self.sum_ab - self.sum_a * self.sum_b / n
+        variance_a = self.sum_aa - self.sum_a * self.sum_a / n
+        variance_b = self.sum_bb - self.sum_b * self.sum_b / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = covariance / np.sqrt(variance_a * variance_b)
+
+        # a - b = d + offset with d the shifted difference
+        offset = self.shift_a - self.shift_b
+        sum_d = self.sum_a - self.sum_b
+        mean_square = (self.sum_dd + 2.0 * offset * sum_d) / n + offset * offset
+        return correlation, np.sqrt(max(mean_square, 0.0))
+
+
+def _read_wav(path: Path) -> Tuple[int, np.ndarray]:
+    """Memory-map a WAV's samples; formats scipy cannot map are read whole."""
+    try:
+        return wavfile.read(path, mmap=True)
+    except ValueError:
+        return wavfile.read(path)
+
+
+def _load_wav_cached(path: Path) -> Tuple[int, np.ndarray]:
+    """Return (sample_rate, mono float32) for a WAV via an .f32.npy sidecar.
+
+    The sidecar holds the unscaled mono downmix, so it streams through
+    _to_mono_float exactly like the raw samples. It is rebuilt when the WAV's
+    mtime no longer matches the one recorded in the .f32.json sentinel.
+    """
+    cache_path = path.with_suffix('.f32.npy')
+    meta_path = path.with_suffix('.f32.json')
+    mtime_ns = path.stat().st_mtime_ns
+    try:
+        meta = load_json(meta_path)
+        if meta.get('mtime_ns') == mtime_ns:
+            return meta['sample_rate'], np.load(cache_path, mmap_mode='r')
+    except (OSError, ValueError, KeyError):
+        pass
+
+    sample_rate, audio = _read_wav(path)
+    if audio.ndim > 1:
+        mono = audio.mean(axis=1, dtype=np.float32)
+    else:
+        mono = audio.astype(np.float32)
+    try:
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.save(f, mono)
+        os.replace(tmp_path, cache_path)
+        write_json(meta_path, {'mtime_ns': mtime_ns, 'sample_rate': sample_rate})
+    except OSError:
+        pass  # read-only capture directory; compare without caching
+    return sample_rate, mono
+
+
+def _waveform_blocks(length: int, nperseg: int, step: int, n_segments: int):
+    """Split a signal into blocks of WAVEFORM_BLOCK_SEGMENTS Welch segments.
+
+    Yields (start, stop, end, count): samples [start, stop) belong to this
+    block for the running sums (the blocks tile the signal), [start, end)
+    also covers the overlap its last Welch segment needs, and count is the
+    number of segments starting in the block.
+    """
+    segment = 0
+    while segment < n_segments:
+        segment_end = min(segment + WAVEFORM_BLOCK_SEGMENTS, n_segments)
+        start = segment * step
+        stop = length if segment_end == n_segments else segment_end * step
+        end = max(stop, (segment_end - 1) * step + nperseg)
+        yield start, stop, end, segment_end - segment
+        segment = segment_end
+
+
+def _segment_power(
+    signals: np.ndarray,
+    window: np.ndarray,
+    step: int,
+    count: int,
+    scratch: WaveformScratch = _SCRATCH
+) -> np.ndarray:
+    """Sum of |rfft|^2 over `count` detrended, windowed Welch segments.
+
+    `signals` is (n_signals, n_samples); every signal's segments go through a
+    single batched rfft and the result is (n_signals, n_freqs).
+    """
+    view = np.lib.stride_tricks.sliding_window_view(signals, len(window), axis=-1)
+    view = view[:, ::step][:, :count]
+    segments = scratch.get('segments', view.shape, np.float32)
+    np.subtract(view, view.mean(axis=-1, keepdims=True), out=segments)
+    segments *= window
+
+    spectrum_shape = view.shape[:-1] + (len(window) // 2 + 1,)
+    if _rfft_has_out():
+        spectrum = np.fft.rfft(
+            segments, axis=-1, out=scratch.get('spectrum', spectrum_shape, np.complex64)
+        )
+    else:
+        spectrum = np.fft.rfft(segments, axis=-1)
 
-    # Handle stereo
-    if audio_baseline.ndim > 1:
-        audio_baseline = np.mean(audio_baseline, axis=1)
-    if audio_current.ndim > 1:
-        audio_current = np.mean(audio_current, axis=1)
+    squares = scratch.get('squares', spectrum_shape, spectrum.real.dtype)
+    power = np.multiply(spectrum.real, spectrum.real, out=squares).sum(axis=1)
+    power += np.multiply(spectrum.imag, spectrum.imag, out=squares).sum(axis=1)
+    return power
 
-    # Match lengths
-    min_len = min(len(audio_baseline), len(audio_current))
-    audio_baseline = audio_baseline[:min_len]
-    audio_current = audio_current[:min_len]
 
-    # Calculate difference metrics
-    diff = audio_baseline - audio_current
-    rms_diff = np.sqrt(np.mean(diff ** 2))
+def compare_waveforms(
+    baseline_wav: Path,
+    current_wav: Path,
+    cache_wavs: bool = False,
+    scratch: WaveformScratch = _SCRATCH
+) -> Dict:
+    """Compare two waveform files and return similarity metrics.
 
-    # Calculate correlation
-    correlation = np.corrcoef(audio_baseline, audio_current)[0, 1]
+    Samples stay memory-mapped and are converted WAVEFORM_BLOCK_SEGMENTS Welch
+    segments at a time in a single pass, so only one block of float data is
+    resident and each sample is decoded once. With cache_wavs, decoded mono
+    samples are kept in .f32.npy sidecars for reuse.
+    """
+    load_dependencies()
 
-    # Spectral difference
-    f_baseline, psd_baseline = signal.welch(audio_baseline, sr_baseline, nperseg=2048)
-    f_current, psd_current = signal.welch(audio_current, sr_current, nperseg=2048)
+    # Map both files, the baseline on the decoder thread
+    read = _load_wav_cached if cache_wavs else _read_wav
+    pending = _decoder().submit(read, baseline_wav)
+    sr_current, raw_current = read(current_wav)
+    sr_baseline, raw_baseline = pending.result()
 
-    psd_diff = np.sqrt(np.mean((10 * np.log10(psd_baseline + 1e-10) -
-                                 10 * np.log10(psd_current + 1e-10)) ** 2))
+    if sr_baseline != sr_current:
+        return {'error': 'Sample rate mismatch'}
+
+    # Match lengths
+    min_len = min(len(raw_baseline), len(raw_current))
+    if min_len == 0:
+        return {'error': 'Empty audio'}
+
+    nperseg = min(WELCH_NPERSEG, min_len)
+    window = _hann(nperseg)
+    step = nperseg - nperseg // 2
+    n_segments = (min_len - nperseg) // step + 1
+
+    # One pass: correlation sums and Welch segment power per block
+    power = np.zeros((2, nperseg // 2 + 1))
+    sums = None
+    for start, stop, end, count in _waveform_blocks(min_len, nperseg, step, n_segments):
+        pair = scratch.get('pair', (2, end - start), np.float32)
+        pending = _decoder().submit(_to_mono_float, raw_baseline[start:end], pair[0])
+        _to_mono_float(raw_current[start:end], out=pair[1])
+        pending.result()
+        owned = pair[:, :stop - start]
+        if sums is None:
+            sums = CorrelationSums(*owned.mean(axis=1, dtype=np.float64))
+        sums.add(owned[0], owned[1])
+        power += _segment_power(pair, window, step, count, scratch)
+
+    correlation, rms_diff = sums.finish()
+
+    # Spectral difference, in place on the power sums: the log of the PSD
+    # ratio is taken as a difference of logs so no ratio array is needed
+    psd = np.multiply(power, _psd_scale(nperseg, sr_baseline) / n_segments, out=power)
+    psd += 1e-10
+    np.log10(psd, out=psd)
+    log_ratio = np.subtract(psd[0], psd[1], out=psd[0])
+    psd_diff = 10 * np.sqrt(np.dot(log_ratio, log_ratio) / log_ratio.size)
 
     return {
         'rms_difference': float(rms_diff),
@@ -101,8 +458,8 @@ def compare_waveforms(baseline_wav: Path, current_wav: Path) -> Dict:
 def compare_rt60(baseline: Dict, current: Dict, threshold: float) -> Tuple[bool, str, float]:
     """Compare RT60 values between baseline and current."""
     # RT60 can be at top level or under 'broadband' key
-    baseline_rt60 = baseline.get('rt60_seconds') or baseline.get('broadband', {}).get('rt60_seconds')
-    current_rt60 = current.get('rt60_seconds') or current.get('broadband', {}).get('rt60_seconds')
+    baseline_rt60 = baseline.get('rt60_seconds') or baseline.get('broadband.rt60_seconds')
+    current_rt60 = current.get('rt60_seconds') or current.get('broadband.rt60_seconds')
 
     if baseline_rt60 is None or current_rt60 is None:
         return False, "Missing RT60 data", 0.0
@@ -117,13 +474,13 @@ def compare_rt60(baseline: Dict, current: Dict, threshold: float) -> Tuple[bool,
 
 def compare_frequency_response(baseline: Dict, current: Dict, threshold: float) -> Tuple[bool, str, float]:
     """Compare frequency response between baseline and current."""
-    baseline_flatness = baseline.get('broadband', {}).get('flatness_db')
-    current_flatness = current.get('broadband', {}).get('flatness_db')
+    baseline_flatness = baseline.get('broadband.flatness_db')
+    current_flatness = current.get('broadband.flatness_db')
 
     if baseline_flatness is None:
-        baseline_flatness = baseline.get('overall', {}).get('flatness_std_db')
+        baseline_flatness = baseline.get('overall.flatness_std_db')
     if current_flatness is None:
-        current_flatness = current.get('overall', {}).get('flatness_std_db')
+        current_flatness = current.get('overall.flatness_std_db')
 
     if baseline_flatness is None or current_flatness is None:
         return False, "Missing frequency response data", 0.0
@@ -147,11 +504,8 @@ def compare_spatial_metrics(
     issues = []
     metrics = {}
 
-    baseline_bb = baseline.get('broadband', {})
-    current_bb = current.get('broadband', {})
-
-    baseline_itd = baseline_bb.get('itd_seconds')
-    current_itd = current_bb.get('itd_seconds')
+    baseline_itd = baseline.get('broadband.itd_seconds')
+    current_itd = current.get('broadband.itd_seconds')
     if baseline_itd is not None and current_itd is not None:
         itd_delta_ms = abs(baseline_itd - current_itd) * 1000.0
         metrics['itd_delta_ms'] = itd_delta_ms
@@ -160,8 +514,8 @@ def compare_spatial_metrics(
                 f"ITD changed by {itd_delta_ms:.3f}ms ({baseline_itd * 1000.0:.3f}ms → {current_itd * 1000.0:.3f}ms)"
             )
 
-    baseline_ild = baseline_bb.get('ild_db')
-    current_ild = current_bb.get('ild_db')
+    baseline_ild = baseline.get('broadband.ild_db')
+    current_ild = current.get('broadband.ild_db')
     if baseline_ild is not None and current_ild is not None:
         ild_delta_db = abs(baseline_ild - current_ild)
         metrics['ild_db_delta'] = ild_delta_db
@@ -170,8 +524,8 @@ def compare_spatial_metrics(
                 f"ILD changed by {ild_delta_db:.2f}dB ({baseline_ild:.2f}dB → {current_ild:.2f}dB)"
             )
 
-    baseline_iacc = baseline_bb.get('iacc')
-    current_iacc = current_bb.get('iacc')
+    baseline_iacc = baseline.get('broadband.iacc')
+    current_iacc = current.get('broadband.iacc')
     if baseline_iacc is not None and current_iacc is not None:
         iacc_delta = abs(baseline_iacc - current_iacc)
         metrics['iacc_delta'] = iacc_delta
@@ -190,9 +544,15 @@ def compare_preset(
     threshold: float,
     itd_ms_threshold: float,
     ild_db_threshold: float,
-    iacc_threshold: float
+    iacc_threshold: float,
+    fail_fast_waveform: bool = True,
+    cache_wavs: bool = False
 ) -> Dict:
-    """Compare a single preset between baseline and current."""
+    """Compare a single preset between baseline and current.
+
+    With fail_fast_waveform, the waveform comparison (the WAV decode and FFTs)
+    is skipped once a metric comparison has already failed the preset.
+    """
     baseline_preset = baseline_dir / f"preset_{preset_idx:02d}"
     current_preset = current_dir / f"preset_{preset_idx:02d}"
 
@@ -203,23 +563,26 @@ def compare_preset(
         'metrics': {}
     }
 
-    # Check if both presets exist
-    if not baseline_preset.exists():
+    # Check if both presets exist; one listing per directory serves every
+    # file check below
+    baseline_entries = scan_preset_dir(baseline_preset)
+    if baseline_entries is None:
         result['pass'] = False
         result['issues'].append("Baseline preset missing")
         return result
 
-    if not current_preset.exists():
+    current_entries = scan_preset_dir(current_preset)
+    if current_entries is None:
         result['pass'] = False
         result['issues'].append("Current preset missing")
         return result
 
     # Load metrics
-    baseline_metrics = load_metrics(baseline_preset)
-    current_metrics = load_metrics(current_preset)
+    baseline_metrics = load_metrics(baseline_preset, baseline_entries)
+    current_metrics = load_metrics(current_preset, current_entries)
 
     # Compare RT60
-    if baseline_metrics.get('rt60') and current_metrics.get('rt60'):
+    if baseline_metrics.get('rt60') is not None and current_metrics.get('rt60') is not None:
         pass_rt60, msg, diff = compare_rt60(
             baseline_metrics['rt60'],
             current_metrics['rt60'],
@@ -231,7 +594,7 @@ def compare_preset(
             result['issues'].append(f"RT60: {msg}")
 
     # Compare frequency response
-    if baseline_metrics.get('freq_response') and current_metrics.get('freq_response'):
+    if baseline_metrics.get('freq_response') is not None and current_metrics.get('freq_response') is not None:
         pass_freq, msg, diff = compare_frequency_response(
             baseline_metrics['freq_response'],
             current_metrics['freq_response'],
@@ -243,7 +606,7 @@ def compare_preset(
             result['issues'].append(f"Frequency: {msg}")
 
     # Compare spatial metrics
-    if baseline_metrics.get('spatial') and current_metrics.get('spatial'):
+    if baseline_metrics.get('spatial') is not None and current_metrics.get('spatial') is not None:
         pass_spatial, issues, spatial_metrics = compare_spatial_metrics(
             baseline_metrics['spatial'],
             current_metrics['spatial'],
@@ -258,12 +621,15 @@ def compare_preset(
             for issue in issues:
                 result['issues'].append(f"Spatial: {issue}")
 
+    if fail_fast_waveform and not result['pass']:
+        return result
+
     # Compare waveforms
     baseline_wav = baseline_preset / "wet.wav"
     current_wav = current_preset / "wet.wav"
 
-    if baseline_wav.exists() and current_wav.exists():
-        waveform_metrics = compare_waveforms(baseline_wav, current_wav)
+    if "wet.wav" in baseline_entries and "wet.wav" in current_entries:
+        waveform_metrics = compare_waveforms(baseline_wav, current_wav, cache_wavs)
 
         if 'error' not in waveform_metrics:
             result['metrics']['waveform'] = waveform_metrics
@@ -285,6 +651,56 @@ def compare_preset(
     return result
 
 
+def preset_cache_key(baseline_preset: Path, current_preset: Path, settings: Tuple) -> Optional[List]:
+    """Everything a preset's result depends on: which preset directories were
+    compared, their input files' sizes and mtimes, and the settings.
+
+    The resolved paths keep a run against a different baseline_dir from
+    reusing results whose files merely share mtimes, as copied or checked-out
+    trees often do. Returns None when either preset directory is missing;
+    those presets are cheap to compare and are never cached.
+    """
+    key = []
+    for preset_dir in (baseline_preset, current_preset):
+        entries = scan_preset_dir(preset_dir)
+        if entries is None:
+            return None
+        stats = {name: entries[name].stat() for name in PRESET_INPUT_FILES if name in entries}
+        key.append([
+            str(preset_dir.resolve()),
+            [[name, stat.st_size, stat.st_mtime_ns] for name, stat in stats.items()],
+        ])
+    key.append(list(settings))
+    return key
+
+
+def load_compare_cache(cache_path: Path) -> Dict[str, Dict]:
+    """Read the --incremental cache, treating a missing or corrupt file as empty."""
+    try:
+        return load_json(cache_path).get('presets', {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _compare_preset_job(job: Tuple) -> Dict:
+    return compare_preset(*job)
+
+
+def compare_presets(jobs: List[Tuple]) -> List[Dict]:
+    """Run compare_preset for each argument tuple, in parallel when possible.
+
+    Results come back in job order.
+    """
+    if len(jobs) > 1:
+        try:
+            workers = min(len(jobs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_compare_preset_job, jobs, chunksize=4))
+        except (OSError, BrokenProcessPool):
+            pass  # Process pools are unavailable in some sandboxes; compare serially
+    return [compare_preset(*job) for job in jobs]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Compare Monument Reverb presets against baseline',
@@ -307,8 +723,21 @@ def main():
                        help='Output JSON report file (optional)')
     parser.add_argument('--preset', '-p', type=int, nargs='+',
                        help='Compare specific presets only (e.g., --preset 0 7 12)')
+    parser.add_argument('--fail-fast-waveform', dest='fail_fast_waveform', action='store_true',
+                       help='Skip the waveform comparison for presets whose metrics already '
+                            'failed (default: on)')
+    parser.add_argument('--no-fail-fast-waveform', dest='fail_fast_waveform', action='store_false',
+                       help='Compare every waveform, even for presets that already failed')
+    parser.set_defaults(fail_fast_waveform=True)
+    parser.add_argument('--cache-wavs', action='store_true',
+                       help='Keep decoded mono samples in wet.f32.npy sidecars and reuse them '
+                            'while the WAV is unchanged')
+    parser.add_argument('--incremental', action='store_true',
+                       help=f'Reuse results from <current_dir>/{COMPARE_CACHE_FILENAME} for presets '
+                            'whose files and thresholds are unchanged since the last run')
 
     args = parser.parse_args()
+    load_dependencies()
 
     if not args.baseline_dir.exists():
         print(f"Error: Baseline directory not found: {args.baseline_dir}")
@@ -336,23 +765,58 @@ def main():
     else:
         preset_indices = range(37)
 
-    # Compare all presets
-    results = []
+    settings = (
+        args.threshold,
+        args.spatial_itd_ms,
+        args.spatial_ild_db,
+        args.spatial_iacc,
+        args.fail_fast_waveform
+    )
+    jobs = [
+        (i, args.baseline_dir, args.current_dir, *settings, args.cache_wavs)
+        for i in preset_indices
+    ]
+    results: List[Optional[Dict]] = [None] * len(jobs)
+
+    # Incremental mode: reuse cached results for presets whose inputs match
+    if args.incremental:
+        cache_path = args.current_dir / COMPARE_CACHE_FILENAME
+        cache = load_compare_cache(cache_path)
+        cache_keys = [
+            preset_cache_key(
+                args.baseline_dir / f"preset_{i:02d}",
+                args.current_dir / f"preset_{i:02d}",
+                settings
+            )
+            for i in preset_indices
+        ]
+        for n, (i, key) in enumerate(zip(preset_indices, cache_keys)):
+            entry = cache.get(str(i))
+            if key is not None and entry and entry.get('key') == key:
+                results[n] = entry['result']
+        reused = len(jobs) - results.count(None)
+        print(f"Incremental: reusing {reused}/{len(jobs)} cached preset results\n")
+
+    # Compare the remaining presets; presets are independent, so they run in
+    # worker processes and are reported in order once all have finished
+    pending = [n for n, result in enumerate(results) if result is None]
+    for n, result in zip(pending, compare_presets([jobs[n] for n in pending])):
+        results[n] = result
+
+    if args.incremental:
+        for i, key, result in zip(preset_indices, cache_keys, results):
+            if key is not None:
+                cache[str(i)] = {'key': key, 'result': result}
+        try:
+            write_json(cache_path, {'presets': cache})
+        except OSError as e:
+            print(f"Warning: Could not write {cache_path}: {e}\n")
+
     pass_count = 0
     fail_count = 0
 
-    for i in preset_indices:
-        result = compare_preset(
-            i,
-            args.baseline_dir,
-            args.current_dir,
-            args.threshold,
-            args.spatial_itd_ms,
-            args.spatial_ild_db,
-            args.spatial_iacc
-        )
-        results.append(result)
-
+    for result in results:
+        i = result['preset_index']
         if result['pass']:
             pass_count += 1
             status = "✓"
@@ -409,8 +873,7 @@ def main():
             'results': results
         }
 
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_json(args.output, report)
 
         print(f"✓ Saved report to: {args.output}\n")
 
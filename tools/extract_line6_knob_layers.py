@@ -15,6 +15,11 @@ from pathlib import Path
 from PIL import Image, ImageDraw, ImageFilter
 import numpy as np
 
+try:
+    from scipy import ndimage as ndi
+except ImportError:  # optional; the pure-Python mask helpers are used instead
+    ndi = None
+
 
 DEFAULT_INPUT_DIR = Path("~/Desktop/Line 6 Delay/knobs").expanduser()
 DEFAULT_OUTPUT_DIR = Path("assets/ui/line6")
@@ -49,32 +54,46 @@ def parse_hex_color(value: str) -> tuple[int, int, int]:
 
 def estimate_background_color(arr: np.ndarray) -> np.ndarray:
     h, w, _ = arr.shape
-    sample = 20
-    corners = [
+    # Square corner patches, clamped so images under 20px still sample corners
+    sample = min(20, h, w)
+    # One copy of the four corner patches; the reshape is then a free view
+    corners = np.stack([
         arr[:sample, :sample, :],
-        arr[:sample, w - sample :, :],
-        arr[h - sample :, :sample, :],
-        arr[h - sample :, w - sample :, :],
-    ]
-    stacked = np.concatenate([c.reshape(-1, 3) for c in corners], axis=0)
-    return np.median(stacked, axis=0)
+        arr[:sample, -sample:, :],
+        arr[-sample:, :sample, :],
+        arr[-sample:, -sample:, :],
+    ]).reshape(-1, 3)
+    return np.median(corners, axis=0)
 
 
 def dilate(mask: np.ndarray, iterations: int = 1) -> np.ndarray:
+    if iterations <= 0:
+        return mask
+    if ndi is not None:
+        return ndi.binary_dilation(mask, structure=EIGHT_CONNECTED, iterations=iterations)
+
+    # A 3x3 dilation is a vertical then a horizontal 3-tap OR; slicing keeps
+    # the image edges from wrapping around
     padded = mask
     for _ in range(iterations):
-        expanded = padded.copy()
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                if dx == 0 and dy == 0:
-                    continue
-                shifted = np.roll(np.roll(padded, dx, axis=0), dy, axis=1)
-                expanded |= shifted
-        padded = expanded
+        rows = padded.copy()
+        rows[1:, :] |= padded[:-1, :]
+        rows[:-1, :] |= padded[1:, :]
+        padded = rows.copy()
+        padded[:, 1:] |= rows[:, :-1]
+        padded[:, :-1] |= rows[:, 1:]
     return padded
 
 
+# 8-connected neighbourhood shared by the mask helpers
+EIGHT_CONNECTED = np.ones((3, 3), dtype=bool)
+
+
 def fill_holes(mask: np.ndarray) -> np.ndarray:
+    if ndi is not None:
+        # Background is flooded from the border through 8-connected pixels
+        return ndi.binary_fill_holes(mask, structure=EIGHT_CONNECTED)
+
     h, w = mask.shape
     visited = np.zeros_like(mask, dtype=bool)
     queue: deque[tuple[int, int]] = deque()
@@ -104,6 +123,16 @@ def fill_holes(mask: np.ndarray) -> np.ndarray:
 
 
 def largest_component(mask: np.ndarray) -> np.ndarray:
+    if ndi is not None:
+        labels, count = ndi.label(mask, structure=EIGHT_CONNECTED)
+        if count == 0:
+            return mask
+        sizes = np.bincount(labels.ravel())
+        sizes[0] = 0  # label 0 is the unmasked area
+        # argmax keeps the first of equal-sized components in raster order,
+        # as the BFS below does
+        return labels == sizes.argmax()
+
     h, w = mask.shape
     visited = np.zeros_like(mask, dtype=bool)
     best_component: list[tuple[int, int]] = []
@@ -17,12 +17,14 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 
 import numpy as np
-from PIL import Image, ImageChops
+from PIL import Image
 
 
 DEFAULT_THRESHOLD = 0.02
 DEFAULT_BACKGROUND_DIFF = 100.0
 DEFAULT_DIFF_AMPLIFY = 10
+# Diff images are throwaway artifacts; favour encode speed over file size.
+PNG_COMPRESS_LEVEL = 1
 
 
 def load_image(path: Path) -> Image.Image:
@@ -32,24 +34,28 @@ def load_image(path: Path) -> Image.Image:
 def compute_background_brightness(arr: np.ndarray, sample_size: int = 20) -> float:
     height, width = arr.shape[:2]
     size = min(sample_size, height, width)
-    corners = [
+    corners = (
         arr[:size, :size],
         arr[:size, width - size : width],
         arr[height - size : height, :size],
         arr[height - size : height, width - size : width],
-    ]
-    samples = np.concatenate([c.reshape(-1, 3) for c in corners], axis=0)
-    r = samples[:, 0].astype(np.float32)
-    g = samples[:, 1].astype(np.float32)
-    b = samples[:, 2].astype(np.float32)
-    return float(0.2126 * r.mean() + 0.7152 * g.mean() + 0.0722 * b.mean())
+    )
+    # The corners are equal-sized views, so the mean of their per-channel
+    # means is the mean over all corner pixels without concatenating copies.
+    r, g, b = np.mean([c.mean(axis=(0, 1)) for c in corners], axis=0)
+    return float(0.2126 * r + 0.7152 * g + 0.0722 * b)
 
 
 def compute_metrics(
     baseline: Image.Image,
     current: Image.Image,
     background_threshold: float,
-) -> Dict[str, float]:
+) -> Tuple[Dict[str, float], np.ndarray]:
+    """Return the comparison metrics and the per-channel absolute diff array.
+
+    The diff array is handed back so the caller can build the diff image from
+    it instead of re-differencing the two images.
+    """
     if baseline.size != current.size:
         raise ValueError("size_mismatch")
 
@@ -57,8 +63,8 @@ def compute_metrics(
     curr_arr = np.asarray(current).astype(np.int16)
     diff_arr = np.abs(base_arr - curr_arr)
 
-    diff_score = float(diff_arr.mean() / 255.0)
     mean_diff = float(diff_arr.mean())
+    diff_score = mean_diff / 255.0
     max_diff = float(diff_arr.max())
 
     changed_pixels = int(np.count_nonzero(np.any(diff_arr > 0, axis=2)))
@@ -69,7 +75,7 @@ def compute_metrics(
     background_diff = float(abs(base_bg - curr_bg))
     background_pass = background_diff <= background_threshold
 
-    return {
+    metrics = {
         "diff_score": diff_score,
         "mean_diff": mean_diff,
         "max_diff": max_diff,
@@ -78,6 +84,7 @@ def compute_metrics(
         "background_diff": background_diff,
         "background_pass": background_pass,
     }
+    return metrics, diff_arr
 
 
 def amplify_diff(diff_image: Image.Image, factor: int) -> Image.Image:
@@ -289,7 +296,7 @@ def main() -> int:
         try:
             baseline_img = load_image(baseline_path)
             current_img = load_image(current_path)
-            metrics = compute_metrics(
+            metrics, diff_arr = compute_metrics(
                 baseline_img, current_img, args.background_threshold
             )
         except ValueError:
@@ -304,12 +311,12 @@ def main() -> int:
             print("  FAIL: size_mismatch")
             continue
 
-        diff_img = ImageChops.difference(baseline_img, current_img)
+        diff_img = Image.fromarray(diff_arr.astype(np.uint8))
         diff_path = diffs_dir / f"{baseline_path.stem}_diff.png"
-        diff_img.save(diff_path)
+        diff_img.save(diff_path, compress_level=PNG_COMPRESS_LEVEL)
         diff_amplified = amplify_diff(diff_img, args.diff_amplify)
         diff_amp_path = diffs_dir / f"{baseline_path.stem}_diff_amplified.png"
-        diff_amplified.save(diff_amp_path)
+        diff_amplified.save(diff_amp_path, compress_level=PNG_COMPRESS_LEVEL)
 
         diff_score = metrics["diff_score"]
         background_pass = metrics["background_pass"]